@@ -1,7 +1,9 @@
-from datetime import date, timedelta
+from datetime import date
 from enum import Enum
 from typing import Set
 
+import numpy as np
+
 
 class Weekend(Enum):
     """Enumeration representing days of the week that can be considered weekend days."""
@@ -18,6 +20,21 @@ class Weekend(Enum):
 class Calendar:
     """A calendar class that handles business days, holidays and weekend calculations."""
 
+    __slots__ = (
+        'name',
+        'holidays',
+        'weekend',
+        '_np_holidays',
+        '_weekmask',
+        '_holiday_bits',
+        '_holiday_ordinals',
+        '_base_ordinal',
+        '_weekend_mask',
+        '_adjust_up_offsets',
+        '_adjust_down_offsets',
+        '_roll_cache',
+    )
+
     def __init__(self, name: str, holidays: Set[date], weekend: Set[Weekend] = {Weekend.SATURDAY, Weekend.SUNDAY}):
         """
         Initialize Calendar instance.
@@ -36,12 +53,29 @@ class Calendar:
         ValueError
             If all days are marked as weekend
         """
-        if self._all_weekend(weekend):
+        weekend_mask = 0
+        for w in weekend:
+            weekend_mask |= 1 << w.value
+        if weekend_mask == 0b1111111:
             raise ValueError('Every day of the week is defined as a weekend. Illegal.')
 
         self.name = name
         self.holidays = set(holidays)  # Ensure we have a copy
         self.weekend = weekend
+        self._np_holidays = None
+        self._weekmask = None
+        self._holiday_bits = None
+        self._holiday_ordinals = None
+        self._base_ordinal = 0
+        self._weekend_mask = weekend_mask
+        self._roll_cache = {}
+        # Days to the nearest non-weekend weekday, looked up by weekday
+        self._adjust_up_offsets = tuple(
+            next(k for k in range(7) if not (weekend_mask >> ((w + k) % 7)) & 1) for w in range(7)
+        )
+        self._adjust_down_offsets = tuple(
+            next(k for k in range(7) if not (weekend_mask >> ((w - k) % 7)) & 1) for w in range(7)
+        )
 
     def __add__(self, other: 'Calendar') -> 'Calendar':
         """
@@ -86,6 +120,7 @@ class Calendar:
             Date to add as holiday
         """
         self.holidays.add(holiday)
+        self._invalidate_cache()
 
     def remove_holiday(self, holiday: date) -> None:
         """
@@ -97,31 +132,113 @@ class Calendar:
             Date to remove from holidays
         """
         self.holidays.discard(holiday)
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """Drop derived holiday state after a mutation."""
+        self._np_holidays = None
+        self._holiday_bits = None
+        self._holiday_ordinals = None
+        self._roll_cache.clear()
+
+    def _build_holiday_bits(self) -> None:
+        """Build the boolean holiday bitmap indexed by ordinal offset from the earliest holiday."""
+        ordinals = self.holiday_ordinals
+        self._base_ordinal = int(ordinals[0])
+        bits = np.zeros(int(ordinals[-1]) - self._base_ordinal + 1, dtype=np.bool_)
+        bits[ordinals - self._base_ordinal] = True
+        self._holiday_bits = bits
+
+    @property
+    def np_holidays(self) -> np.ndarray:
+        """Sorted holidays as a ``datetime64[D]`` array, rebuilt lazily after mutations."""
+        if self._np_holidays is None:
+            self._np_holidays = np.array(sorted(self.holidays), dtype='datetime64[D]')
+        return self._np_holidays
+
+    @property
+    def holiday_ordinals(self) -> np.ndarray:
+        """Sorted holiday ordinals as an ``int64`` array, rebuilt lazily after mutations."""
+        if self._holiday_ordinals is None:
+            ordinals = np.fromiter((h.toordinal() for h in self.holidays), dtype=np.int64, count=len(self.holidays))
+            ordinals.sort()
+            self._holiday_ordinals = ordinals
+        return self._holiday_ordinals
+
+    @property
+    def weekmask(self) -> str:
+        """Seven-character business-day mask (Monday first) derived from the weekend set."""
+        if self._weekmask is None:
+            self._weekmask = ''.join('0' if Weekend(i) in self.weekend else '1' for i in range(7))
+        return self._weekmask
 
     def is_weekend(self, date_: date) -> bool:
         """Check if given date falls on a weekend."""
-        return self._is_weekend(date_, self.weekend)
-
-    @staticmethod
-    def _is_weekend(date_: date, weekend: Set[Weekend]) -> bool:
-        weekday = date_.weekday()
-        # The weekend_map keys should match Python's weekday() values (0-6 starting from Monday)
-        weekend_map = {
-            0: Weekend.MONDAY,
-            1: Weekend.TUESDAY,
-            2: Weekend.WEDNESDAY,
-            3: Weekend.THURSDAY,
-            4: Weekend.FRIDAY,
-            5: Weekend.SATURDAY,
-            6: Weekend.SUNDAY,
-        }
-        return weekend_map[weekday] in weekend
+        return bool((self._weekend_mask >> date_.weekday()) & 1)
 
     def is_business_day(self, date_: date) -> bool:
         """Check if given date is a business day."""
-        if self.is_weekend(date_):
+        return self.is_business_day_ord(date_.toordinal())
+
+    def is_business_day_ord(self, ordinal: int) -> bool:
+        """Check if the date with the given proleptic Gregorian ordinal is a business day."""
+        if (self._weekend_mask >> ((ordinal - 1) % 7)) & 1:
             return False
-        return date_ not in self.holidays
+        if not self.holidays:
+            return True
+        if self._holiday_bits is None:
+            self._build_holiday_bits()
+        offset = ordinal - self._base_ordinal
+        return offset < 0 or offset >= self._holiday_bits.shape[0] or not self._holiday_bits[offset]
+
+    def business_days_between(self, from_date: date, to_date: date) -> int:
+        """
+        Count business days in the half-open range [from_date, to_date).
+
+        Computed in closed form from the weekend mask and sorted holiday ordinals,
+        without touching the individual days.
+
+        Parameters
+        ----------
+        from_date : date
+            Start of the range, included
+        to_date : date
+            End of the range, excluded
+
+        Returns
+        -------
+        int
+            Number of business days; negative if to_date is before from_date
+        """
+        if to_date < from_date:
+            return -self.business_days_between(to_date, from_date)
+
+        start_ord = from_date.toordinal()
+        end_ord = to_date.toordinal() - 1
+        count = end_ord - start_ord + 1
+        if count <= 0:
+            return 0
+
+        # Subtract weekend days per weekend weekday: ordinal o falls on weekday (o - 1) % 7
+        for weekday, working in enumerate(self.weekmask):
+            if working == '0':
+                first = start_ord + (weekday - (start_ord - 1)) % 7
+                if first <= end_ord:
+                    count -= (end_ord - first) // 7 + 1
+
+        # Weekends-only calendars are done; otherwise subtract holidays in range
+        # that do not already fall on a weekend
+        if not self.holidays:
+            return count
+
+        ordinals = self.holiday_ordinals
+        if ordinals.shape[0]:
+            lo, hi = np.searchsorted(ordinals, (start_ord, end_ord + 1))
+            in_range = ordinals[lo:hi]
+            on_weekend = (self._weekend_mask >> ((in_range - 1) % 7)) & 1
+            count -= int(in_range.shape[0] - np.count_nonzero(on_weekend))
+
+        return count
 
     def add_business_days(self, from_date: date, days: int, adjust_up: bool) -> date:
         """
@@ -142,20 +259,43 @@ class Calendar:
         date
             Resulting date after adding business days
         """
-        date_ = self.adjust_up(from_date) if adjust_up else self.adjust_down(from_date)
-        if days == 0:
-            return date_
-
-        step = 1 if days >= 0 else -1
-        count = 0
-        days = abs(days)
+        if not self.holidays and self._weekend_mask == 0b1100000:
+            return self._add_business_days_standard(from_date, days, adjust_up)
+
+        result = np.busday_offset(
+            np.datetime64(from_date, 'D'),
+            days,
+            roll='forward' if adjust_up else 'backward',
+            weekmask=self.weekmask,
+            holidays=self.np_holidays,
+        )
+        return result.astype('datetime64[D]').item()
 
-        while count != days:
-            date_ = date_ + timedelta(days=step)
-            if self.is_business_day(date_):
-                count += 1
-
-        return date_
+    @staticmethod
+    def _add_business_days_standard(from_date: date, days: int, adjust_up: bool) -> date:
+        """Closed-form business-day addition for a holiday-free Saturday/Sunday calendar."""
+        ordinal = from_date.toordinal()
+        weekday = from_date.weekday()
+
+        if weekday > 4:
+            if adjust_up:
+                ordinal += 7 - weekday
+                weekday = 0
+            else:
+                ordinal -= weekday - 4
+                weekday = 4
+
+        weeks, remainder = divmod(abs(days), 5)
+        if days >= 0:
+            ordinal += weeks * 7 + remainder
+            if weekday + remainder > 4:
+                ordinal += 2  # Remainder straddles a weekend
+        else:
+            ordinal -= weeks * 7 + remainder
+            if weekday - remainder < 0:
+                ordinal -= 2  # Remainder straddles a weekend
+
+        return date.fromordinal(ordinal)
 
     def adjust_up(self, from_date: date) -> date:
         """
@@ -171,14 +311,14 @@ class Calendar:
         date
             Next business day
         """
-        date_ = from_date
-        while not self.is_business_day(date_):
-            date_ = date_ + timedelta(days=1)
-        return date_
+        result = date.fromordinal(from_date.toordinal() + self._adjust_up_offsets[from_date.weekday()])
+        while not self.is_business_day(result):
+            result = date.fromordinal(result.toordinal() + 1 + self._adjust_up_offsets[(result.weekday() + 1) % 7])
+        return result
 
-    def adjust_down(self, from_date: date) -> date:
+    def adjust_modified_following(self, from_date: date) -> date:
         """
-        Adjust date downward to previous business day.
+        Adjust date to the next business day, unless that crosses a month boundary.
 
         Parameters
         ----------
@@ -188,35 +328,47 @@ class Calendar:
         Returns
         -------
         date
-            Previous business day
+            Next business day, or the previous one if the next falls in a new month
         """
-        date_ = from_date
-        while not self.is_business_day(date_):
-            date_ = date_ + timedelta(days=-1)
-        return date_
+        result = self.adjust_up(from_date)
+        if result.month != from_date.month:
+            return self.adjust_down(from_date)
+        return result
 
-    @staticmethod
-    def _all_weekend(weekend: Set[Weekend]) -> bool:
+    def adjust_modified_previous(self, from_date: date) -> date:
+        """
+        Adjust date to the previous business day, unless that crosses a month boundary.
+
+        Parameters
+        ----------
+        from_date : date
+            Date to adjust
+
+        Returns
+        -------
+        date
+            Previous business day, or the next one if the previous falls in an earlier month
         """
-        Check if all days are marked as weekend.
+        result = self.adjust_down(from_date)
+        if result.month != from_date.month:
+            return self.adjust_up(from_date)
+        return result
+
+    def adjust_down(self, from_date: date) -> date:
+        """
+        Adjust date downward to previous business day.
 
         Parameters
         ----------
-        weekend : Set[Weekend]
-            Set of weekend days to check
+        from_date : date
+            Date to adjust
 
         Returns
         -------
-        bool
-            True if all days are weekend, False otherwise
-        """
-        all_days = {
-            Weekend.MONDAY,
-            Weekend.TUESDAY,
-            Weekend.WEDNESDAY,
-            Weekend.THURSDAY,
-            Weekend.FRIDAY,
-            Weekend.SATURDAY,
-            Weekend.SUNDAY,
-        }
-        return weekend == all_days
+        date
+            Previous business day
+        """
+        result = date.fromordinal(from_date.toordinal() - self._adjust_down_offsets[from_date.weekday()])
+        while not self.is_business_day(result):
+            result = date.fromordinal(result.toordinal() - 1 - self._adjust_down_offsets[(result.weekday() - 1) % 7])
+        return result
@@ -1,11 +1,32 @@
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import List, Optional
 
+import numpy as np
+
 from .calendar import Calendar
 from .frequency import Frequency
-from .roll import RollType
+from .roll import _DEFAULT_CALENDAR, RollType
 from .tenor import TenorUnit
 
+# Roll conventions that map one-to-one onto numpy.busday_offset roll modes.
+_BUSDAY_ROLL = {
+    RollType.FOLLOWING: 'following',
+    RollType.PREVIOUS: 'preceding',
+    RollType.MODIFIED_FOLLOWING: 'modifiedfollowing',
+    RollType.MODIFIED_PREVIOUS: 'modifiedpreceding',
+}
+
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_IN_MONTH = np.array(_MONTH_DAYS, dtype=np.int64)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Return the number of days in the given month."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_DAYS[month - 1]
+
 
 class DateMath:
     """
@@ -50,39 +71,100 @@ class DateMath:
         if amount == 0:
             return from_date
 
-        match unit:
-            case TenorUnit.YEAR:
-                result = _add_years(from_date, amount)
-            case TenorUnit.MONTH:
-                result = _add_months(from_date, amount)
-            case TenorUnit.WEEK:
-                result = from_date + timedelta(weeks=amount)
-            case TenorUnit.DAY:
-                result = from_date + timedelta(days=amount)
-            case _:
-                raise ValueError(f'Invalid tenor unit: {unit}')
+        handler = _TENOR_DISPATCH.get(unit)
+        if handler is None:
+            raise ValueError(f'Invalid tenor unit: {unit}')
+        result = handler(from_date, amount)
 
         if roll_type and calendar:
             return roll_type.roll(result, calendar)
         return result
 
+    @staticmethod
+    def add_tenor_batch(
+        dates: np.ndarray,
+        amount: int,
+        unit: TenorUnit,
+        roll_type: Optional[RollType] = None,
+        calendar: Optional[Calendar] = None,
+    ) -> np.ndarray:
+        """
+        Add a tenor to an array of dates in one vectorized pass.
+
+        Equivalent to applying :meth:`add_tenor` element-wise, but month and year steps are
+        computed with ``datetime64`` arithmetic and rolling is delegated to a single
+        ``numpy.busday_offset`` call where the convention maps onto a numpy roll mode.
+
+        Parameters
+        ----------
+        dates : np.ndarray
+            Base dates, convertible to dtype ``datetime64[D]``
+        amount : int
+            Amount to add
+        unit : TenorUnit
+            Unit of the tenor
+        roll_type : Optional[RollType], default=None
+            Roll convention to apply
+        calendar : Optional[Calendar], default=None
+            Calendar for business day adjustments
+
+        Returns
+        -------
+        np.ndarray
+            Resulting dates with dtype ``datetime64[D]``
+        """
+        dates = np.asarray(dates, dtype='datetime64[D]')
+
+        if amount == 0:
+            return dates.copy()
+        if unit is TenorUnit.DAY:
+            result = dates + amount
+        elif unit is TenorUnit.WEEK:
+            result = dates + 7 * amount
+        elif unit is TenorUnit.MONTH or unit is TenorUnit.YEAR:
+            result = _add_months_np(dates, amount * 12 if unit is TenorUnit.YEAR else amount)
+        else:
+            raise ValueError(f'Invalid tenor unit: {unit}')
+
+        if roll_type and calendar:
+            if roll_type in _BUSDAY_ROLL:
+                return np.busday_offset(
+                    result, 0, roll=_BUSDAY_ROLL[roll_type], weekmask=calendar.weekmask, holidays=calendar.np_holidays
+                )
+            rolled = [roll_type.roll(date_, calendar) for date_ in result.tolist()]
+            return np.array(rolled, dtype='datetime64[D]')
+        return result
+
     @staticmethod
     def _generate_forward_dates(
         start: date, roll: date, maturity: date, months_per_period: int, roll_type: RollType, calendar: Calendar
     ) -> List[date]:
         """Generate dates in forward order."""
+        rolled_cache = {}
+
+        def roll_once(date_: date) -> date:
+            rolled = rolled_cache.get(date_)
+            if rolled is None:
+                rolled = rolled_cache[date_] = roll_type.roll(date_, calendar)
+            return rolled
+
         dates = []
         if roll != start:
-            dates.append(roll_type.roll(roll, calendar))
+            dates.append(roll_once(roll))
 
+        anchor_year, anchor_month, anchor_day = roll.year, roll.month, roll.day
         current = roll
         while current < maturity:
-            current = DateMath.add_tenor(roll, len(dates) * months_per_period, TenorUnit.MONTH, roll_type, calendar)
+            months = len(dates) * months_per_period
+            if months == 0:
+                current = roll
+            else:
+                current = roll_once(date(*_add_months_ymd(anchor_year, anchor_month, anchor_day, months)))
             if current < maturity:
                 dates.append(current)
 
         if maturity > roll:
-            dates.append(roll_type.roll(maturity, calendar))
+            dates.append(roll_once(maturity))
         return dates
 
     @staticmethod
@@ -90,18 +172,87 @@ class DateMath:
         start: date, roll: date, maturity: date, months_per_period: int, roll_type: RollType, calendar: Calendar
     ) -> List[date]:
         """Generate dates in reverse order."""
-        dates = [roll_type.roll(maturity, calendar)]
+        rolled_cache = {}
+
+        def roll_once(date_: date) -> date:
+            rolled = rolled_cache.get(date_)
+            if rolled is None:
+                rolled = rolled_cache[date_] = roll_type.roll(date_, calendar)
+            return rolled
+
+        dates = [roll_once(maturity)]
+        anchor_year, anchor_month, anchor_day = maturity.year, maturity.month, maturity.day
         current = maturity
 
         while current > roll:
-            current = DateMath.add_tenor(
-                maturity, -len(dates) * months_per_period, TenorUnit.MONTH, roll_type, calendar
-            )
+            months = -len(dates) * months_per_period
+            current = roll_once(date(*_add_months_ymd(anchor_year, anchor_month, anchor_day, months)))
             if current > roll:
-                dates.insert(0, current)
+                dates.append(current)
+
+        if roll > start:
+            dates.append(roll)
+
+        dates.reverse()
+        return dates
+
+    @staticmethod
+    def _monthly_anchors_np(anchor: date, months_per_period: int, count: int, sign: int) -> np.ndarray:
+        """Build unadjusted dates anchor + sign * k * months_per_period (k = 1..count) as datetime64[D]."""
+        ks = np.arange(1, count + 1, dtype=np.int64)
+        total_months = anchor.month - 1 + sign * ks * months_per_period
+        years = anchor.year + total_months // 12
+        months = total_months % 12 + 1
+        leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+        days = np.minimum(anchor.day, _DAYS_IN_MONTH[months - 1] + ((months == 2) & leap))
+        return ((years - 1970) * 12 + months - 1).astype('datetime64[M]').astype('datetime64[D]') + (days - 1)
+
+    @staticmethod
+    def _generate_forward_dates_np(
+        start: date, roll: date, maturity: date, months_per_period: int, roll_type: RollType, calendar: Calendar
+    ) -> List[date]:
+        """Generate dates in forward order, rolling the whole schedule in one busday_offset call."""
+        dates = []
+        if roll != start:
+            dates.append(roll_type.roll(roll, calendar))
+        elif roll < maturity:
+            dates.append(roll)
+
+        span_months = (maturity.year - roll.year) * 12 + maturity.month - roll.month
+        raw = DateMath._monthly_anchors_np(roll, months_per_period, span_months // months_per_period + 2, 1)
+        rolled = np.busday_offset(
+            raw, 0, roll=_BUSDAY_ROLL[roll_type], weekmask=calendar.weekmask, holidays=calendar.np_holidays
+        )
+        for rolled_date in rolled.tolist():
+            if rolled_date >= maturity:
+                break
+            dates.append(rolled_date)
+
+        if maturity > roll:
+            dates.append(roll_type.roll(maturity, calendar))
+        return dates
+
+    @staticmethod
+    def _generate_reverse_dates_np(
+        start: date, roll: date, maturity: date, months_per_period: int, roll_type: RollType, calendar: Calendar
+    ) -> List[date]:
+        """Generate dates in reverse order, rolling the whole schedule in one busday_offset call."""
+        dates = [roll_type.roll(maturity, calendar)]
+
+        span_months = (maturity.year - roll.year) * 12 + maturity.month - roll.month
+        raw = DateMath._monthly_anchors_np(maturity, months_per_period, span_months // months_per_period + 2, -1)
+        rolled = np.busday_offset(
+            raw, 0, roll=_BUSDAY_ROLL[roll_type], weekmask=calendar.weekmask, holidays=calendar.np_holidays
+        )
+        for rolled_date in rolled.tolist():
+            if rolled_date <= roll:
+                break
+            dates.append(rolled_date)
 
         if roll > start:
-            dates.insert(0, roll)
+            dates.append(roll)
+
+        dates.reverse()
         return dates
 
     @staticmethod
@@ -147,17 +298,45 @@ class DateMath:
         if start > roll or roll > maturity:
             raise ValueError('Dates must be in order: start <= roll <= maturity')
 
-        frequency = frequency or Frequency.QUARTERLY
+        # ONCE has value 0, so test for None explicitly rather than truthiness
+        if frequency is None:
+            frequency = Frequency.QUARTERLY
         if frequency in (Frequency.ONCE, Frequency.CONTINUOUS, Frequency.OTHER):
             raise ValueError('Frequency must not be ONCE, CONTINUOUS, or OTHER for date generation')
 
         roll_type = roll_type or RollType.MODIFIED_FOLLOWING
-        calendar = calendar or Calendar('default', set())
+        calendar = calendar or _DEFAULT_CALENDAR
         months_per_period = int(frequency.period_months())
 
-        return (DateMath._generate_reverse_dates if reverse else DateMath._generate_forward_dates)(
-            start, roll, maturity, months_per_period, roll_type, calendar
-        )
+        if roll_type in _BUSDAY_ROLL:
+            generator = DateMath._generate_reverse_dates_np if reverse else DateMath._generate_forward_dates_np
+        else:
+            generator = DateMath._generate_reverse_dates if reverse else DateMath._generate_forward_dates
+        return generator(start, roll, maturity, months_per_period, roll_type, calendar)
+
+    @staticmethod
+    def generate_dates_np(
+        start: date,
+        roll: date,
+        maturity: date,
+        frequency: Optional[Frequency] = None,
+        roll_type: Optional[RollType] = None,
+        reverse: bool = False,
+        calendar: Optional[Calendar] = None,
+    ) -> np.ndarray:
+        """
+        Generate a schedule as a ``datetime64[D]`` array.
+
+        Accepts the same parameters as :meth:`generate_dates` and produces the same schedule,
+        returned as a numpy array for callers that feed it into further vectorized calculations.
+
+        Returns
+        -------
+        np.ndarray
+            Generated dates with dtype ``datetime64[D]``
+        """
+        dates = DateMath.generate_dates(start, roll, maturity, frequency, roll_type, reverse, calendar)
+        return np.array(dates, dtype='datetime64[D]')
 
     @staticmethod
     def add_business_days(from_date: date, days: int, calendar: Calendar, adjust_up: bool = True) -> date:
@@ -180,39 +359,51 @@ class DateMath:
         date
             Resulting date after adding business days
         """
-        date_ = calendar.adjust_up(from_date) if adjust_up else calendar.adjust_down(from_date)
+        return calendar.add_business_days(from_date, days, adjust_up)
 
-        if days == 0:
-            return date_
 
-        step = 1 if days >= 0 else -1
-        remaining = abs(days)
-
-        while remaining > 0:
-            date_ = date_ + timedelta(days=step)
-            if calendar.is_business_day(date_):
-                remaining -= 1
-
-        return date_
+def _add_months_np(dates: np.ndarray, months: int) -> np.ndarray:
+    """Add months to a ``datetime64[D]`` array, clamping each day to the end of the target month."""
+    month_starts = dates.astype('datetime64[M]')
+    days = (dates - month_starts.astype('datetime64[D]')).astype(np.int64) + 1
+    total_months = month_starts.astype(np.int64) + months
+    years = total_months // 12 + 1970
+    new_months = total_months % 12 + 1
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    new_days = np.minimum(days, _DAYS_IN_MONTH[new_months - 1] + ((new_months == 2) & leap))
+    return total_months.astype('datetime64[M]').astype('datetime64[D]') + (new_days - 1)
 
 
 def _add_months(date_: date, months: int) -> date:
     """Add months to a date, preserving end-of-month if applicable."""
-    year = date_.year + ((date_.month - 1 + months) // 12)
-    month = (date_.month - 1 + months) % 12 + 1
+    return date(*_add_months_ymd(date_.year, date_.month, date_.day, months))
+
 
-    # Try to maintain same day of month
-    try:
-        return date(year, month, date_.day)
-    except ValueError:
-        # If day is invalid (e.g. Feb 30), return end of month
-        return date(year, month + 1, 1) - timedelta(days=1)
+@lru_cache(maxsize=8192)
+def _add_months_ymd(year: int, month: int, day: int, months: int) -> tuple[int, int, int]:
+    """Add months to a (year, month, day) triple, clamping to end of month."""
+    new_year = year + ((month - 1 + months) // 12)
+    new_month = (month - 1 + months) % 12 + 1
+
+    # Maintain same day of month, clamping to end of month (e.g. Feb 30 -> Feb 28/29)
+    return new_year, new_month, min(day, _days_in_month(new_year, new_month))
 
 
 def _add_years(date_: date, years: int) -> date:
     """Add years to a date, preserving end-of-month if applicable."""
-    try:
-        return date(date_.year + years, date_.month, date_.day)
-    except ValueError:
-        # Handle Feb 29 in leap years
-        return date(date_.year + years, date_.month, 28)
+    return date(*_add_years_ymd(date_.year, date_.month, date_.day, years))
+
+
+@lru_cache(maxsize=8192)
+def _add_years_ymd(year: int, month: int, day: int, years: int) -> tuple[int, int, int]:
+    """Add years to a (year, month, day) triple, clamping Feb 29 to Feb 28."""
+    # Clamp Feb 29 when the target year is not a leap year
+    return year + years, month, min(day, _days_in_month(year + years, month))
+
+
+_TENOR_DISPATCH = {
+    TenorUnit.YEAR: _add_years,
+    TenorUnit.MONTH: _add_months,
+    TenorUnit.WEEK: lambda date_, amount: date_ + timedelta(weeks=amount),
+    TenorUnit.DAY: lambda date_, amount: date_ + timedelta(days=amount),
+}
@@ -1,12 +1,28 @@
 from datetime import date, timedelta
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
+
 from .calendar import Calendar
 from .frequency import Frequency
 
-
-class DayCount(Enum):
+# Frequencies the ICMA conventions reject, and (annual factor, months per period) for the rest
+_ICMA_INVALID_FREQS = frozenset(
+    {Frequency.ONCE, Frequency.BIWEEKLY, Frequency.WEEKLY, Frequency.DAILY, Frequency.OTHER, Frequency.CONTINUOUS}
+)
+_FREQ_FACTOR_MONTHS = {
+    Frequency.BIANNUAL: (0.5, 24),
+    Frequency.ANNUAL: (1.0, 12),
+    Frequency.SEMIANNUAL: (2.0, 6),
+    Frequency.QUARTERLY: (4.0, 3),
+    Frequency.BIMONTHLY: (6.0, 2),
+    Frequency.MONTHLY: (12.0, 1),
+}
+
+
+class DayCount(IntEnum):
     """
     Enumeration for day count conventions.
 
@@ -95,599 +111,820 @@ class DayCount(Enum):
         if end < start:
             raise ValueError('End date must not be before start date')
 
-        dispatch = {
-            DayCount.ACT_360: lambda: self._act_360(start, end),
-            DayCount.ACT_365: lambda: self._act_365(start, end),
-            DayCount.ACT_365_NL: lambda: self._act_365_nl(start, end),
-            DayCount.ACT_ACT: lambda: self._act_act(start, end),
-            DayCount.ACT_ACT_AFB: lambda: self._act_act_afb(start, end),
-            DayCount.THIRTY_360: lambda: self._thirty_360(start, end),
-            DayCount.THIRTY_360_E: lambda: self._thirty_360_e(start, end),
-            DayCount.THIRTY_360_ISDA: lambda: self._validate_and_calc_isda(start, end, maturity),
-            DayCount.THIRTY_360_US: lambda: self._thirty_360_us(start, end),
-            DayCount.BUSINESS_252: lambda: self._validate_and_calc_business(start, end, calendar),
-            DayCount.ACT_ACT_ICMA: lambda: self._validate_and_calc_icma(start, end, maturity, payment, frequency),
-            DayCount.ACT_365_ICMA: lambda: self._validate_and_calc_icma_365(start, end, maturity, payment, frequency),
-        }
-
-        return dispatch[self]()
-
-    @classmethod
-    def _act_360(cls, start: date, end: date) -> float:
-        """
-        Actual/360 day count.
+        # The two most common conventions are pure arithmetic; skip dispatch and caching
+        if self is DayCount.ACT_360:
+            return (end.toordinal() - start.toordinal()) / 360.0
+        if self is DayCount.ACT_365:
+            return (end.toordinal() - start.toordinal()) / 365.0
 
-        Parameters
-        ----------
-        start : date
-            Start date
-        end : date
-            End date
+        if calendar is None:
+            # Calendar-free conventions depend only on immutable arguments, so results are memoized
+            return _fraction_cached(self, start, end, maturity, payment, frequency)
+        return self._handler(start, end, maturity, calendar, payment, frequency)
 
-        Returns
-        -------
-        float
-            Day count fraction using Actual/360 convention
+    def fraction_array(
+        self, start: np.ndarray, end: np.ndarray, maturity: Optional[date] = None, calendar: Optional[Calendar] = None
+    ) -> np.ndarray:
         """
-        return (end - start).days / 360.0
+        Calculate year fractions for arrays of date pairs.
 
-    @classmethod
-    def _act_365(cls, start: date, end: date) -> float:
-        """
-        Actual/365 day count.
+        Vectorized counterpart to :meth:`fraction` for the non-ICMA conventions; the whole
+        schedule is evaluated with numpy instead of one Python call per period.
 
         Parameters
         ----------
-        start : date
-            Start date
-        end : date
-            End date
+        start : np.ndarray
+            Start dates, convertible to ``datetime64[D]``
+        end : np.ndarray
+            End dates, convertible to ``datetime64[D]``
+        maturity : Optional[date], default=None
+            Maturity date, required for 30E/360 ISDA
+        calendar : Optional[Calendar], default=None
+            Calendar for business day calculations, required for Business/252
 
         Returns
         -------
-        float
-            Day count fraction using Actual/365 convention
-        """
-        return (end - start).days / 365.0
+        np.ndarray
+            Year fractions as ``float64``, matching :meth:`fraction` element-wise
 
-    @classmethod
-    def _act_365_icma(cls, start: date, end: date, maturity: date, payment: date, frequency: Frequency) -> float:
+        Raises
+        ------
+        ValueError
+            If the convention has no vectorized form (ICMA and AFB variants), any end date
+            precedes its start date, or required parameters are missing
         """
-        Actual/365 ICMA day count.
+        handler = _FRACTION_ARRAY_HANDLERS[self]
+        if handler is None:
+            raise ValueError(f'fraction_array is not supported for {self.name}')
 
-        This convention divides the actual number of days by 365, then divides by the frequency.
-        It's commonly used for money market instruments.
+        starts = np.asarray(start, dtype='datetime64[D]')
+        ends = np.asarray(end, dtype='datetime64[D]')
+        if np.any(ends < starts):
+            raise ValueError('End date must not be before start date')
 
-        Key features:
-        1. Uses actual days in numerator
-        2. Uses 365 days in denominator
-        3. Considers payment frequency for period calculations
-        4. Special handling for non-aligned periods
-        5. Different calculation for forward/backward periods
+        return handler(starts, ends, maturity, calendar)
 
-        Parameters
-        ----------
-        start : date
-            Start date of the period
-        end : date
-            End date of the period
-        maturity : date
-            Final maturity date
-        payment : date
-            Next payment date
-        frequency : Frequency
-            Payment frequency (e.g., SEMIANNUAL = 2, QUARTERLY = 4)
 
-        Returns
-        -------
-        float
-            Year fraction according to ACT/365 ICMA convention
-        """
-        freq_factor = frequency.annual_frequency()
-        months_per_period = int(frequency.period_months())
-
-        # Check if dates align with frequency
-        if cls._check_period_alignment(start, payment, months_per_period) and cls._check_date_alignment(start, payment):
-            days = (end - start).days
-            if days > 365 / freq_factor and end != payment:
-                # Special case: period exceeds standard length
-                return 1 / freq_factor - 1 / 365
-            # Regular case: actual days / 365
-            return days / 365
-
-        # Handle non-aligned periods
-        current, target, direction = cls._get_period_dates(start, payment, maturity)
-
-        total_fraction = 0.0
-        while direction * (current - target).days < 0:
-            next_date = cls._get_next_period_date(current, direction * months_per_period)
-            period_start = max(start, min(next_date, current))
-            period_end = min(end, max(next_date, current))
-
-            days = (period_end - period_start).days
-            if days > 0:
-                if direction == -1 and period_end == current and period_start == next_date:
-                    days = 365 / freq_factor
-                elif direction == 1 and period_end == next_date and period_start == current:
-                    days = 365 / freq_factor
-                total_fraction += days / (365 / freq_factor)
-
-            current = next_date
-
-        return total_fraction / freq_factor
-
-    @classmethod
-    def _act_365_nl(cls, start: date, end: date) -> float:
-        """
-        Actual/365 No Leap day count.
+def _act_360(start: date, end: date) -> float:
+    """
+    Actual/360 day count.
 
-        Parameters
-        ----------
-        start : date
-            Start date
-        end : date
-            End date
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+
+    Returns
+    -------
+    float
+        Day count fraction using Actual/360 convention
+    """
+    return (end.toordinal() - start.toordinal()) / 360.0
 
-        Returns
-        -------
-        float
-            Day count fraction using Actual/365 No Leap convention
 
-        Notes
-        -----
-        Counts actual days excluding February 29th divided by 365
-        """
-        current = start
-        days = 0
+def _act_365(start: date, end: date) -> float:
+    """
+    Actual/365 day count.
 
-        while current < end:
-            if not (current.month == 2 and current.day == 29):
-                days += 1
-            current += timedelta(days=1)
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+
+    Returns
+    -------
+    float
+        Day count fraction using Actual/365 convention
+    """
+    return (end.toordinal() - start.toordinal()) / 365.0
 
-        return days / 365.0
 
-    @classmethod
-    def _act_act(cls, start: date, end: date) -> float:
-        """
-        Actual/Actual day count.
+def _act_365_icma(start: date, end: date, maturity: date, payment: date, frequency: Frequency) -> float:
+    """
+    Actual/365 ICMA day count.
 
-        Parameters
-        ----------
-        start : date
-            Start date
-        end : date
-            End date
+    This convention divides the actual number of days by 365, then divides by the frequency.
+    It's commonly used for money market instruments.
 
-        Returns
-        -------
-        float
-            Day count fraction using Actual/Actual convention
+    Key features:
+    1. Uses actual days in numerator
+    2. Uses 365 days in denominator
+    3. Considers payment frequency for period calculations
+    4. Special handling for non-aligned periods
+    5. Different calculation for forward/backward periods
 
-        Notes
-        -----
-        This implementation follows the ISDA method where the fraction is calculated as:
-        years + (end - start_of_end_year)/(days_in_end_year) - (start - start_of_start_year)/(days_in_start_year)
-        """
-        start_year_begin = date(start.year, 1, 1)
-        end_year_begin = date(end.year, 1, 1)
-        start_next_year = date(start.year + 1, 1, 1)
-        end_next_year = date(end.year + 1, 1, 1)
-
-        return (
-            (end.year - start.year)
-            + (end - end_year_begin).days / (end_next_year - end_year_begin).days
-            - (start - start_year_begin).days / (start_next_year - start_year_begin).days
-        )
-
-    @classmethod
-    def _act_act_afb(cls, start: date, end: date) -> float:
-        """
-        Actual/Actual AFB day count.
+    Parameters
+    ----------
+    start : date
+        Start date of the period
+    end : date
+        End date of the period
+    maturity : date
+        Final maturity date
+    payment : date
+        Next payment date
+    frequency : Frequency
+        Payment frequency (e.g., SEMIANNUAL = 2, QUARTERLY = 4)
+
+    Returns
+    -------
+    float
+        Year fraction according to ACT/365 ICMA convention
+    """
+    freq_factor, months_per_period = _FREQ_FACTOR_MONTHS[frequency]
 
-        Parameters
-        ----------
-        start : date
-            Start date
-        end : date
-            End date
+    # Check if dates align with frequency
+    if _check_period_alignment(start, payment, months_per_period) and _check_date_alignment(start, payment):
+        days = (end - start).days
+        if days > 365 / freq_factor and end != payment:
+            # Special case: period exceeds standard length
+            return 1 / freq_factor - 1 / 365
+        # Regular case: actual days / 365
+        return days / 365
 
-        Returns
-        -------
-        float
-            Day count fraction using Actual/Actual AFB convention
+    period_days = 365 / freq_factor
 
-        Notes
-        -----
-        French Bond Market Association (AFB) method
-        """
-        days = (end - start).days
+    def period_fraction(days, current, next_date, period_start, period_end, direction):
+        # A full period counts as exactly one regardless of its actual length
+        if direction == -1 and period_end == current and period_start == next_date:
+            return 1.0
+        if direction == 1 and period_end == next_date and period_start == current:
+            return 1.0
+        return days / period_days
+
+    return _icma_walk(start, end, maturity, payment, months_per_period, period_fraction) / freq_factor
+
+
+def _act_365_nl(start: date, end: date) -> float:
+    """
+    Actual/365 No Leap day count.
+
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+
+    Returns
+    -------
+    float
+        Day count fraction using Actual/365 No Leap convention
+
+    Notes
+    -----
+    Counts actual days excluding February 29th divided by 365
+    """
+    days = end.toordinal() - start.toordinal()
+    return (days - (_feb29_count(end) - _feb29_count(start))) / 365.0
+
+
+def _act_act(start: date, end: date) -> float:
+    """
+    Actual/Actual day count.
+
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+
+    Returns
+    -------
+    float
+        Day count fraction using Actual/Actual convention
+
+    Notes
+    -----
+    This implementation follows the ISDA method where the fraction is calculated as:
+    years + (end - start_of_end_year)/(days_in_end_year) - (start - start_of_start_year)/(days_in_start_year)
+    """
+    start_year_begin, start_year_days = _year_bounds(start.year)
+    end_year_begin, end_year_days = _year_bounds(end.year)
+
+    return (
+        (end.year - start.year)
+        + (end.toordinal() - end_year_begin) / end_year_days
+        - (start.toordinal() - start_year_begin) / start_year_days
+    )
+
+
+def _act_act_afb(start: date, end: date) -> float:
+    """
+    Actual/Actual AFB day count.
+
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+
+    Returns
+    -------
+    float
+        Day count fraction using Actual/Actual AFB convention
+
+    Notes
+    -----
+    French Bond Market Association (AFB) method
+    """
+    total = 0.0
+    start_ordinal = start.toordinal()
+
+    while True:
+        days = end.toordinal() - start_ordinal
         denominator = 365.0
         is_multi_year = days > 366.0
 
         if not is_multi_year:
-            if not cls._is_leap_year(start.year) and not cls._is_leap_year(end.year):
+            if not _is_leap_year(start.year) and not _is_leap_year(end.year):
                 is_multi_year = days > 365.0
-                denominator = 365.0
             else:
-                leap_year = start.year if cls._is_leap_year(start.year) else end.year
+                leap_year = start.year if _is_leap_year(start.year) else end.year
                 leap_day = date(leap_year, 2, 29)
 
                 if start <= leap_day <= end:
                     denominator = 366.0
                 else:
                     is_multi_year = days > 365.0
-                    denominator = 365.0
 
         if not is_multi_year:
-            return days / denominator
+            return total + days / denominator
 
-        # Handle multi-year periods recursively
+        # Strip one whole year off the end; each contributes 1, except when the new
+        # end lands on Feb 29 (the stripped year then spans 365 of 366 days)
         if end.month == 2 and end.day == 29:
-            prev_year_end = date(end.year - 1, 2, 28)
-        elif end.month == 2 and end.day == 28 and cls._is_leap_year(end.year - 1):
-            prev_year_end = date(end.year - 1, 2, 29)
+            end = date(end.year - 1, 2, 28)
+            total += 1.0
+        elif end.month == 2 and end.day == 28 and _is_leap_year(end.year - 1):
+            end = date(end.year - 1, 2, 29)
+            total += 365.0 / 366.0
         else:
-            prev_year_end = date(end.year - 1, end.month, end.day)
+            end = date(end.year - 1, end.month, end.day)
+            total += 1.0
 
-        return cls._act_act_afb(start, prev_year_end) + cls._act_act_afb(prev_year_end, end)
 
-    @classmethod
-    def _act_act_icma(cls, start: date, end: date, maturity: date, payment: date, frequency: Frequency) -> float:
-        """
-        Actual/Actual ICMA day count.
+def _act_act_icma(start: date, end: date, maturity: date, payment: date, frequency: Frequency) -> float:
+    """
+    Actual/Actual ICMA day count.
 
-        This convention divides the actual number of days in a period by the actual number of days
-        in the coupon period, then divides by the frequency. It's commonly used for bonds.
+    This convention divides the actual number of days in a period by the actual number of days
+    in the coupon period, then divides by the frequency. It's commonly used for bonds.
 
-        Key features:
-        1. Uses actual days in both numerator and denominator
-        2. Considers payment frequency for period calculations
-        3. Special handling for non-aligned periods
-        4. Different calculation for forward/backward periods
+    Key features:
+    1. Uses actual days in both numerator and denominator
+    2. Considers payment frequency for period calculations
+    3. Special handling for non-aligned periods
+    4. Different calculation for forward/backward periods
 
-        Parameters
-        ----------
-        start : date
-            Start date of the period
-        end : date
-            End date of the period
-        maturity : date
-            Final maturity date
-        payment : date
-            Next payment date
-        frequency : Frequency
-            Payment frequency (e.g., SEMIANNUAL = 2, QUARTERLY = 4)
+    Parameters
+    ----------
+    start : date
+        Start date of the period
+    end : date
+        End date of the period
+    maturity : date
+        Final maturity date
+    payment : date
+        Next payment date
+    frequency : Frequency
+        Payment frequency (e.g., SEMIANNUAL = 2, QUARTERLY = 4)
+
+    Returns
+    -------
+    float
+        Year fraction according to ACT/ACT ICMA convention
+    """
+    freq_factor, months_per_period = _FREQ_FACTOR_MONTHS[frequency]
 
-        Returns
-        -------
-        float
-            Year fraction according to ACT/ACT ICMA convention
-        """
-        freq_factor = frequency.annual_frequency()
-        months_per_period = int(frequency.period_months())
+    if _check_period_alignment(start, payment, months_per_period) and _check_date_alignment(start, payment):
+        return (end - start).days / ((payment - start).days * freq_factor)
 
-        if cls._check_period_alignment(start, payment, months_per_period) and cls._check_date_alignment(start, payment):
-            return (end - start).days / ((payment - start).days * freq_factor)
+    def period_fraction(days, current, next_date, period_start, period_end, direction):
+        return direction * days / (next_date - current).days
 
-        current, target, direction = cls._get_period_dates(start, payment, maturity)
+    return _icma_walk(start, end, maturity, payment, months_per_period, period_fraction) / freq_factor
 
-        total_fraction = 0.0
-        while direction * (current - target).days < 0:
-            next_date = cls._get_next_period_date(current, direction * months_per_period)
-            period_start = max(start, min(next_date, current))
-            period_end = min(end, max(next_date, current))
 
-            days = (period_end - period_start).days
-            if days > 0:
-                total_fraction += direction * days / (next_date - current).days
+def _thirty_360(start: date, end: date) -> float:
+    """
+    30/360 day count.
 
-            current = next_date
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+
+    Returns
+    -------
+    float
+        Day count fraction using 30/360 convention
+
+    Notes
+    -----
+    - If the end date is 31 and the start date is greater than or equal to 30, the end date is treated as 30 days.
+    - If the start date is 31, it is treated as 30 days.
+    """
+    start_year, start_month, start_day = start.year, start.month, start.day
+    end_year, end_month, end_day = end.year, end.month, end.day
+    d1 = start_day - (start_day == 31)
+    d2 = end_day - (end_day == 31 and start_day >= 30)
 
-        return total_fraction / freq_factor
+    return (_thirty_360_value(end_year, end_month, d2) - _thirty_360_value(start_year, start_month, d1)) / 360.0
 
-    @classmethod
-    def _thirty_360(cls, start: date, end: date) -> float:
-        """
-        30/360 day count.
 
-        Parameters
-        ----------
-        start : date
-            Start date
-        end : date
-            End date
+def _thirty_360_e(start: date, end: date) -> float:
+    """
+    30E/360 (Eurobond) day count.
 
-        Returns
-        -------
-        float
-            Day count fraction using 30/360 convention
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+
+    Returns
+    -------
+    float
+        Day count fraction using 30E/360 convention
+
+    Notes
+    -----
+    - If the end date is 31, it is treated as 30 days.
+    - If the start date is 31, it is treated as 30 days.
+    """
+    start_year, start_month, start_day = start.year, start.month, start.day
+    end_year, end_month, end_day = end.year, end.month, end.day
+    d1 = start_day - (start_day == 31)
+    d2 = end_day - (end_day == 31)
 
-        Notes
-        -----
-        - If the end date is 31 and the start date is greater than or equal to 30, the end date is treated as 30 days.
-        - If the start date is 31, it is treated as 30 days.
-        """
-        d1 = min(start.day, 30) if start.day != 31 else 30
-        d2 = end.day if end.day != 31 else (30 if start.day >= 30 else 31)
+    return (_thirty_360_value(end_year, end_month, d2) - _thirty_360_value(start_year, start_month, d1)) / 360.0
 
-        return (360 * (end.year - start.year) + 30 * (end.month - start.month) + (d2 - d1)) / 360.0
 
-    @classmethod
-    def _thirty_360_e(cls, start: date, end: date) -> float:
-        """
-        30E/360 (Eurobond) day count.
+def _thirty_360_isda(start: date, end: date, maturity: date) -> float:
+    """
+    30E/360 ISDA day count.
 
-        Parameters
-        ----------
-        start : date
-            Start date
-        end : date
-            End date
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+    maturity : date
+        Maturity date
+
+    Returns
+    -------
+    float
+        Day count fraction using 30E/360 ISDA convention
+
+    Notes
+    -----
+    - If the start date is the last day of February, it is treated as 30 days.
+    - If the end date is the last day of February, except for the maturity, it is treated as 30 days.
+    - If the end date is 31 and the start date is greater than or equal to 30, the end date is treated as 30 days.
+    - If the start date is 31, it is treated as 30 days.
+    """
+    start_year, start_month, start_day = start.year, start.month, start.day
+    end_year, end_month, end_day = end.year, end.month, end.day
 
-        Returns
-        -------
-        float
-            Day count fraction using 30E/360 convention
+    d1 = (
+        (30 if _is_last_day_of_february(start) else (30 if start_day == 31 else start_day))
+        if start_month != 2
+        else start_day
+    )
 
-        Notes
-        -----
-        - If the end date is 31, it is treated as 30 days.
-        - If the start date is 31, it is treated as 30 days.
-        """
-        d1 = 30 if start.day == 31 else start.day
-        d2 = 30 if end.day == 31 else end.day
+    d2 = (
+        (end_day if end == maturity else 30)
+        if _is_last_day_of_february(end)
+        else (30 if end_day == 31 else end_day)
+        if end_month != 2
+        else end_day
+    )
 
-        return (360 * (end.year - start.year) + 30 * (end.month - start.month) + (d2 - d1)) / 360.0
+    return (_thirty_360_value(end_year, end_month, d2) - _thirty_360_value(start_year, start_month, d1)) / 360.0
 
-    @classmethod
-    def _thirty_360_isda(cls, start: date, end: date, maturity: date) -> float:
-        """
-        30E/360 ISDA day count.
 
-        Parameters
-        ----------
-        start : date
-            Start date
-        end : date
-            End date
-        maturity : date
-            Maturity date
+def _thirty_360_us(start: date, end: date) -> float:
+    """
+    30/360 US day count.
 
-        Returns
-        -------
-        float
-            Day count fraction using 30E/360 ISDA convention
-
-        Notes
-        -----
-        - If the start date is the last day of February, it is treated as 30 days.
-        - If the end date is the last day of February, except for the maturity, it is treated as 30 days.
-        - If the end date is 31 and the start date is greater than or equal to 30, the end date is treated as 30 days.
-        - If the start date is 31, it is treated as 30 days.
-        """
-        d1 = (
-            (30 if cls._is_last_day_of_february(start) else (30 if start.day == 31 else start.day))
-            if start.month != 2
-            else start.day
-        )
-
-        d2 = (
-            (end.day if end == maturity else 30)
-            if cls._is_last_day_of_february(end)
-            else (30 if end.day == 31 else end.day)
-            if end.month != 2
-            else end.day
-        )
-
-        return (360 * (end.year - start.year) + 30 * (end.month - start.month) + (d2 - d1)) / 360.0
-
-    @classmethod
-    def _thirty_360_us(cls, start: date, end: date) -> float:
-        """
-        30/360 US day count.
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+
+    Returns
+    -------
+    float
+        Day count fraction using 30/360 US convention
+
+    Notes
+    -----
+    - If the end date is the last day of February, it is treated as 30 days.
+    - If the start date is the last day of February, it is treated as 30 days.
+    - If the end date is 31 and the start date is greater than or equal to 30, the end date is treated as 30 days.
+    - If the start date is 31, it is treated as 30 days.
+    """
+    start_year, start_month, d1 = start.year, start.month, start.day
+    end_year, end_month, d2 = end.year, end.month, end.day
 
-        Parameters
-        ----------
-        start : date
-            Start date
-        end : date
-            End date
+    start_ultimo_feb = _is_last_day_of_february(start)
+    if start_ultimo_feb and _is_last_day_of_february(end):
+        d2 = 30
+    if start_ultimo_feb:
+        d1 = 30
+    if d2 == 31 and d1 >= 30:
+        d2 = 30
+    if d1 == 31:
+        d1 = 30
 
-        Returns
-        -------
-        float
-            Day count fraction using 30/360 US convention
-
-        Notes
-        -----
-        - If the end date is the last day of February, it is treated as 30 days.
-        - If the start date is the last day of February, it is treated as 30 days.
-        - If the end date is 31 and the start date is greater than or equal to 30, the end date is treated as 30 days.
-        - If the start date is 31, it is treated as 30 days.
-        """
-        d1 = start.day
-        d2 = end.day
-
-        if cls._is_last_day_of_february(start) and cls._is_last_day_of_february(end):
-            d2 = 30
-        if cls._is_last_day_of_february(start):
-            d1 = 30
-        if d2 == 31 and d1 >= 30:
-            d2 = 30
-        if d1 == 31:
-            d1 = 30
-
-        return (360 * (end.year - start.year) + 30 * (end.month - start.month) + (d2 - d1)) / 360.0
-
-    @classmethod
-    def _business_252(cls, start: date, end: date, calendar: Calendar) -> float:
-        """
-        Business/252 day count.
+    return (_thirty_360_value(end_year, end_month, d2) - _thirty_360_value(start_year, start_month, d1)) / 360.0
 
-        Counts actual business days (excluding holidays and weekends)
-        divided by 252 trading days per year.
 
-        Parameters
-        ----------
-        start : date
-            Start date
-        end : date
-            End date
-        calendar : Calendar
-            Calendar for business day calculations
+def _business_252(start: date, end: date, calendar: Calendar) -> float:
+    """
+    Business/252 day count.
 
-        Returns
-        -------
-        float
-            Day count fraction using Business/252 convention
-        """
-        business_days = sum(
-            1 for d in range((end - start).days + 1) if calendar.is_business_day(start + timedelta(days=d))
-        )
-        return business_days / 252.0
-
-    def _validate_and_calc_isda(self, start: date, end: date, maturity: Optional[date]) -> float:
-        """Validate and calculate 30E/360 ISDA day count."""
-        if maturity is None:
-            raise ValueError('Maturity date required for 30E/360 ISDA calculations')
-        if maturity < start:
-            raise ValueError('Maturity date must be greater than start date for 30E/360 ISDA')
-        if maturity < end:
-            raise ValueError('Maturity date must be greater than end date for 30E/360 ISDA')
-        return self._thirty_360_isda(start, end, maturity)
-
-    def _validate_and_calc_business(self, start: date, end: date, calendar: Optional[Calendar]) -> float:
-        """Validate and calculate Business/252 day count."""
-        if calendar is None:
-            raise ValueError('Calendar required for Business/252 calculations')
-        return self._business_252(start, end, calendar)
+    Counts actual business days (excluding holidays and weekends)
+    divided by 252 trading days per year.
 
-    def _validate_and_calc_icma(
-        self, start: date, end: date, maturity: Optional[date], payment: Optional[date], frequency: Optional[Frequency]
-    ) -> float:
-        """Validate and calculate ACT/ACT ICMA day count."""
-        if not all([maturity, payment, frequency]):
-            raise ValueError('Maturity, payment dates and frequency required for ACT/ACT ICMA')
-        if maturity < payment:
-            raise ValueError('Maturity date must be greater than payment date for ACT/ACT ICMA')
-        if payment < end:
-            raise ValueError('Payment date must be greater than end date for ACT/ACT ICMA')
-        if frequency in (
-            Frequency.ONCE,
-            Frequency.BIWEEKLY,
-            Frequency.WEEKLY,
-            Frequency.DAILY,
-            Frequency.OTHER,
-            Frequency.CONTINUOUS,
-        ):
-            raise ValueError('Frequency must not be ONCE, BIWEEKLY, WEEKLY, DAILY, or OTHER for ACT/ACT ICMA')
-        return self._act_act_icma(start, end, maturity, payment, frequency)
-
-    def _validate_and_calc_icma_365(
-        self, start: date, end: date, maturity: Optional[date], payment: Optional[date], frequency: Optional[Frequency]
-    ) -> float:
-        """Validate and calculate ACT/365 ICMA day count."""
-        if not all([maturity, payment, frequency]):
-            raise ValueError('Maturity, payment dates and frequency required for ACT/365 ICMA')
-        if maturity < payment:
-            raise ValueError('Maturity date must be greater than payment date for ACT/365 ICMA')
-        if payment < end:
-            raise ValueError('Payment date must be greater than end date for ACT/365 ICMA')
-        if frequency in (
-            Frequency.ONCE,
-            Frequency.BIWEEKLY,
-            Frequency.WEEKLY,
-            Frequency.DAILY,
-            Frequency.OTHER,
-            Frequency.CONTINUOUS,
-        ):
-            raise ValueError('Frequency must not be ONCE, BIWEEKLY, WEEKLY, DAILY, or OTHER for ACT/365 ICMA')
-        return self._act_365_icma(start, end, maturity, payment, frequency)
-
-    @staticmethod
-    def _is_leap_year(year: int) -> bool:
-        """Check if year is a leap year."""
-        try:
-            date(year, 2, 29)
-            return True
-        except ValueError:
-            return False
-
-    @staticmethod
-    def _is_last_day_of_february(date_: date) -> bool:
-        """Check if date is the last day of February."""
-        next_date = date_ + timedelta(days=1)
-        return next_date.month == 3 and next_date.day == 1
-
-    @staticmethod
-    def _get_new_month(month: int, number: int) -> int:
-        """Get new month after adding number of months."""
-        total = month + number
-        if total <= 0:
-            return total % 12
-        return (total - 1) % 12 + 1
-
-    @staticmethod
-    def _get_new_year(year: int, month: int, number: int) -> int:
-        """Get new year after adding number of months."""
-        total = month + number
-        return year + (total - 1) // 12
-
-    @staticmethod
-    def _is_ultimo(date_: date) -> bool:
-        """Check if date is the last day of month."""
-        return (date_ + timedelta(days=1)).day == 1
-
-    @staticmethod
-    def _get_ultimo(year: int, month: int) -> date:
-        """Get last day of month."""
-        if month == 12:
-            year += 1
-            month = 1
-        else:
-            month += 1
-        return date(year, month, 1) - timedelta(days=1)
-
-    @staticmethod
-    def _invalid_date(year: int, month: int, day: int) -> bool:
-        """Check if date would be invalid."""
-        try:
-            test_date = date(year, month, 1)
-            return (test_date + timedelta(days=day - 1)).month != month
-        except ValueError:
-            return True
-
-    @classmethod
-    def _get_next_period_date(cls, current: date, months: int) -> date:
-        """Get the next period date based on months offset."""
-        year = cls._get_new_year(current.year, current.month, months)
-        month = cls._get_new_month(current.month, months)
-
-        if cls._invalid_date(year, month, current.day):
-            return cls._get_ultimo(year, month)
-        return date(year, month, current.day)
-
-    @classmethod
-    def _get_period_dates(cls, start: date, payment: date, maturity: date) -> tuple[date, date, int]:
-        """Get period dates for ICMA calculations."""
-        direction = 1 if payment == maturity else -1
-        current = start if direction == 1 else payment
-        target = payment if direction == 1 else start
-        return current, target, direction
-
-    @classmethod
-    def _check_period_alignment(cls, start: date, payment: date, months_per_period: int) -> bool:
-        """Check if dates align with payment frequency."""
-        year_diff = payment.year - start.year
-        month_diff = payment.month - start.month
-        return year_diff * 12 + month_diff == months_per_period
-
-    @classmethod
-    def _check_date_alignment(cls, start: date, payment: date) -> bool:
-        """Check if dates align on same day or ultimo."""
-        return (
-            start.day == payment.day
-            or (cls._invalid_date(start.year, start.month, payment.day) and cls._is_ultimo(start))
-            or (cls._invalid_date(payment.year, payment.month, start.day) and cls._is_ultimo(payment))
-        )
+    Parameters
+    ----------
+    start : date
+        Start date
+    end : date
+        End date
+    calendar : Calendar
+        Calendar for business day calculations
+
+    Returns
+    -------
+    float
+        Day count fraction using Business/252 convention
+    """
+    return calendar.business_days_between(start, end + timedelta(days=1)) / 252.0
+
+
+def _validate_and_calc_isda(start: date, end: date, maturity: Optional[date]) -> float:
+    """Validate and calculate 30E/360 ISDA day count."""
+    if maturity is None:
+        raise ValueError('Maturity date required for 30E/360 ISDA calculations')
+    if maturity < start:
+        raise ValueError('Maturity date must be greater than start date for 30E/360 ISDA')
+    if maturity < end:
+        raise ValueError('Maturity date must be greater than end date for 30E/360 ISDA')
+    return _thirty_360_isda(start, end, maturity)
+
+
+def _validate_and_calc_business(start: date, end: date, calendar: Optional[Calendar]) -> float:
+    """Validate and calculate Business/252 day count."""
+    if calendar is None:
+        raise ValueError('Calendar required for Business/252 calculations')
+    return _business_252(start, end, calendar)
+
+
+def _validate_and_calc_icma(
+    start: date, end: date, maturity: Optional[date], payment: Optional[date], frequency: Optional[Frequency]
+) -> float:
+    """Validate and calculate ACT/ACT ICMA day count."""
+    if maturity is None or payment is None or frequency is None:
+        raise ValueError('Maturity, payment dates and frequency required for ACT/ACT ICMA')
+    if maturity < payment:
+        raise ValueError('Maturity date must be greater than payment date for ACT/ACT ICMA')
+    if payment < end:
+        raise ValueError('Payment date must be greater than end date for ACT/ACT ICMA')
+    if frequency in _ICMA_INVALID_FREQS:
+        raise ValueError('Frequency must not be ONCE, BIWEEKLY, WEEKLY, DAILY, or OTHER for ACT/ACT ICMA')
+    return _act_act_icma(start, end, maturity, payment, frequency)
+
+
+def _validate_and_calc_icma_365(
+    start: date, end: date, maturity: Optional[date], payment: Optional[date], frequency: Optional[Frequency]
+) -> float:
+    """Validate and calculate ACT/365 ICMA day count."""
+    if maturity is None or payment is None or frequency is None:
+        raise ValueError('Maturity, payment dates and frequency required for ACT/365 ICMA')
+    if maturity < payment:
+        raise ValueError('Maturity date must be greater than payment date for ACT/365 ICMA')
+    if payment < end:
+        raise ValueError('Payment date must be greater than end date for ACT/365 ICMA')
+    if frequency in _ICMA_INVALID_FREQS:
+        raise ValueError('Frequency must not be ONCE, BIWEEKLY, WEEKLY, DAILY, or OTHER for ACT/365 ICMA')
+    return _act_365_icma(start, end, maturity, payment, frequency)
+
+
+def _thirty_360_value(year: int, month: int, day: int) -> int:
+    """Map a (year, month, day) triple onto the 30/360 day scale."""
+    return 360 * year + 30 * month + day
+
+
+def _year_start_ordinal(year: int) -> int:
+    """Return the ordinal of January 1st of the given year."""
+    prev = year - 1
+    return prev * 365 + prev // 4 - prev // 100 + prev // 400 + 1
+
+
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap_year(year: int) -> bool:
+    """Check if year is a leap year."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Return the number of days in the given month."""
+    if month == 2 and _is_leap_year(year):
+        return 29
+    return _MONTH_DAYS[month - 1]
+
+
+def _feb29_count(date_: date) -> int:
+    """Count February 29ths strictly before the given date."""
+    prev = date_.year - 1
+    return prev // 4 - prev // 100 + prev // 400 + (date_.month > 2 and _is_leap_year(date_.year))
+
+
+def _is_last_day_of_february(date_: date) -> bool:
+    """Check if date is the last day of February."""
+    return date_.month == 2 and date_.day == 28 + _is_leap_year(date_.year)
+
+
+def _add_months_ym(year: int, month: int, number: int) -> tuple[int, int]:
+    """Add a number of months (possibly negative) to a (year, month) pair."""
+    years_delta, month_index = divmod(month - 1 + number, 12)
+    return year + years_delta, month_index + 1
+
+
+def _is_ultimo(date_: date) -> bool:
+    """Check if date is the last day of month."""
+    return date_.day == _days_in_month(date_.year, date_.month)
+
+
+def _get_ultimo(year: int, month: int) -> date:
+    """Get last day of month."""
+    return date(year, month, _days_in_month(year, month))
+
+
+def _invalid_date(year: int, month: int, day: int) -> bool:
+    """Check if date would be invalid."""
+    if not 1 <= month <= 12 or not 1 <= year <= 9999:
+        return True
+    return not 1 <= day <= _days_in_month(year, month)
+
+
+def _icma_walk(start: date, end: date, maturity: date, payment: date, months_per_period: int, period_fraction) -> float:
+    """
+    Walk coupon periods for non-aligned ICMA dates and sum each period's contribution.
+
+    ``period_fraction`` receives the overlapping day count, the period boundaries and the
+    walk direction, and returns that period's share; the denominator rule is the only part
+    that differs between the ACT/ACT and ACT/365 variants.
+    """
+    current, target, direction = _get_period_dates(start, payment, maturity)
+
+    total_fraction = 0.0
+    while direction * (current - target).days < 0:
+        next_date = _get_next_period_date(current, direction * months_per_period)
+        period_start = max(start, min(next_date, current))
+        period_end = min(end, max(next_date, current))
+
+        days = (period_end - period_start).days
+        if days > 0:
+            total_fraction += period_fraction(days, current, next_date, period_start, period_end, direction)
+
+        current = next_date
+
+    return total_fraction
+
+
+@lru_cache(maxsize=8192)
+def _get_next_period_date(current: date, months: int) -> date:
+    """Get the next period date based on months offset, memoized across the ICMA walks."""
+    year, month = _add_months_ym(current.year, current.month, months)
+
+    if _invalid_date(year, month, current.day):
+        return _get_ultimo(year, month)
+    return date(year, month, current.day)
+
+
+def _get_period_dates(start: date, payment: date, maturity: date) -> tuple[date, date, int]:
+    """Get period dates for ICMA calculations."""
+    direction = 1 if payment == maturity else -1
+    current = start if direction == 1 else payment
+    target = payment if direction == 1 else start
+    return current, target, direction
+
+
+def _check_period_alignment(start: date, payment: date, months_per_period: int) -> bool:
+    """Check if dates align with payment frequency."""
+    year_diff = payment.year - start.year
+    month_diff = payment.month - start.month
+    return year_diff * 12 + month_diff == months_per_period
+
+
+def _check_date_alignment(start: date, payment: date) -> bool:
+    """Check if dates align on same day or ultimo."""
+    if start.day == payment.day:
+        return True
+    return (_invalid_date(start.year, start.month, payment.day) and _is_ultimo(start)) or (
+        _invalid_date(payment.year, payment.month, start.day) and _is_ultimo(payment)
+    )
+
+
+# Year-start ordinals for the trading-relevant range; years outside fall back to the closed form
+_YEAR_LUT_START = 1900
+_YEAR_LUT_END = 2200
+_YEAR_START_ORDINALS = tuple(_year_start_ordinal(year) for year in range(_YEAR_LUT_START, _YEAR_LUT_END + 2))
+
+
+def _year_bounds(year: int) -> tuple[int, int]:
+    """Return the ordinal of January 1st and the number of days in the given year."""
+    if _YEAR_LUT_START <= year <= _YEAR_LUT_END:
+        index = year - _YEAR_LUT_START
+        year_begin = _YEAR_START_ORDINALS[index]
+        return year_begin, _YEAR_START_ORDINALS[index + 1] - year_begin
+    year_begin = _year_start_ordinal(year)
+    return year_begin, 365 + _is_leap_year(year)
+
+
+def _ymd_np(dates: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split a ``datetime64[D]`` array into year, month and day integer arrays."""
+    month_starts = dates.astype('datetime64[M]')
+    total_months = month_starts.astype(np.int64)
+    years = total_months // 12 + 1970
+    months = total_months % 12 + 1
+    days = (dates - month_starts).astype(np.int64) + 1
+    return years, months, days
+
+
+def _is_leap_year_np(years: np.ndarray) -> np.ndarray:
+    """Vectorized Gregorian leap-year check."""
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+def _feb29_count_np(dates: np.ndarray) -> np.ndarray:
+    """Count February 29ths strictly before each date."""
+    years, months, _ = _ymd_np(dates)
+    prev = years - 1
+    return prev // 4 - prev // 100 + prev // 400 + ((months > 2) & _is_leap_year_np(years))
+
+
+def _last_day_of_february_np(years: np.ndarray, months: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """Vectorized last-day-of-February check on split date fields."""
+    return (months == 2) & (days == 28 + _is_leap_year_np(years))
+
+
+def _act_360_np(starts: np.ndarray, ends: np.ndarray, maturity: Optional[date], calendar: Optional[Calendar]):
+    return (ends - starts).astype(np.int64) / 360.0
+
+
+def _act_365_np(starts: np.ndarray, ends: np.ndarray, maturity: Optional[date], calendar: Optional[Calendar]):
+    return (ends - starts).astype(np.int64) / 365.0
+
+
+def _act_365_nl_np(starts: np.ndarray, ends: np.ndarray, maturity: Optional[date], calendar: Optional[Calendar]):
+    days = (ends - starts).astype(np.int64)
+    return (days - (_feb29_count_np(ends) - _feb29_count_np(starts))) / 365.0
+
+
+def _act_act_np(starts: np.ndarray, ends: np.ndarray, maturity: Optional[date], calendar: Optional[Calendar]):
+    start_year_begins = starts.astype('datetime64[Y]')
+    end_year_begins = ends.astype('datetime64[Y]')
+    start_years = start_year_begins.astype(np.int64) + 1970
+    end_years = end_year_begins.astype(np.int64) + 1970
+    start_year_days = 365.0 + _is_leap_year_np(start_years)
+    end_year_days = 365.0 + _is_leap_year_np(end_years)
+    return (
+        (end_years - start_years)
+        + (ends - end_year_begins).astype(np.int64) / end_year_days
+        - (starts - start_year_begins).astype(np.int64) / start_year_days
+    )
+
+
+def _thirty_360_np(starts: np.ndarray, ends: np.ndarray, maturity: Optional[date], calendar: Optional[Calendar]):
+    start_years, start_months, start_days = _ymd_np(starts)
+    end_years, end_months, end_days = _ymd_np(ends)
+    d1 = start_days - (start_days == 31)
+    d2 = end_days - ((end_days == 31) & (start_days >= 30))
+    return (360 * (end_years - start_years) + 30 * (end_months - start_months) + (d2 - d1)) / 360.0
+
+
+def _thirty_360_e_np(starts: np.ndarray, ends: np.ndarray, maturity: Optional[date], calendar: Optional[Calendar]):
+    start_years, start_months, start_days = _ymd_np(starts)
+    end_years, end_months, end_days = _ymd_np(ends)
+    d1 = start_days - (start_days == 31)
+    d2 = end_days - (end_days == 31)
+    return (360 * (end_years - start_years) + 30 * (end_months - start_months) + (d2 - d1)) / 360.0
+
+
+def _thirty_360_isda_np(starts: np.ndarray, ends: np.ndarray, maturity: Optional[date], calendar: Optional[Calendar]):
+    if maturity is None:
+        raise ValueError('Maturity date required for 30E/360 ISDA calculations')
+    maturity64 = np.datetime64(maturity, 'D')
+    if np.any(starts > maturity64):
+        raise ValueError('Maturity date must be greater than start date for 30E/360 ISDA')
+    if np.any(ends > maturity64):
+        raise ValueError('Maturity date must be greater than end date for 30E/360 ISDA')
+
+    start_years, start_months, start_days = _ymd_np(starts)
+    end_years, end_months, end_days = _ymd_np(ends)
+    d1 = np.where(start_months != 2, start_days - (start_days == 31), start_days)
+    d2 = np.where(
+        _last_day_of_february_np(end_years, end_months, end_days),
+        np.where(ends == maturity64, end_days, 30),
+        np.where(end_months != 2, end_days - (end_days == 31), end_days),
+    )
+    return (360 * (end_years - start_years) + 30 * (end_months - start_months) + (d2 - d1)) / 360.0
+
+
+def _thirty_360_us_np(starts: np.ndarray, ends: np.ndarray, maturity: Optional[date], calendar: Optional[Calendar]):
+    start_years, start_months, start_days = _ymd_np(starts)
+    end_years, end_months, end_days = _ymd_np(ends)
+    start_ultimo_feb = _last_day_of_february_np(start_years, start_months, start_days)
+    end_ultimo_feb = _last_day_of_february_np(end_years, end_months, end_days)
+
+    d2 = np.where(start_ultimo_feb & end_ultimo_feb, 30, end_days)
+    d1 = np.where(start_ultimo_feb, 30, start_days)
+    d2 = np.where((d2 == 31) & (d1 >= 30), 30, d2)
+    d1 = np.where(d1 == 31, 30, d1)
+    return (360 * (end_years - start_years) + 30 * (end_months - start_months) + (d2 - d1)) / 360.0
+
+
+def _business_252_np(starts: np.ndarray, ends: np.ndarray, maturity: Optional[date], calendar: Optional[Calendar]):
+    if calendar is None:
+        raise ValueError('Calendar required for Business/252 calculations')
+    counts = np.busday_count(
+        starts, ends + np.timedelta64(1, 'D'), weekmask=calendar.weekmask, holidays=calendar.np_holidays
+    )
+    return counts / 252.0
+
+
+# Handler tuples are indexed by DayCount value; index 0 is padding since values start at 1
+_FRACTION_ARRAY_HANDLERS = (
+    None,
+    _act_360_np,
+    _act_365_np,
+    None,  # ACT_365_ICMA has no vectorized form
+    _act_365_nl_np,
+    _act_act_np,
+    None,  # ACT_ACT_AFB has no vectorized form
+    None,  # ACT_ACT_ICMA has no vectorized form
+    _thirty_360_np,
+    _thirty_360_e_np,
+    _thirty_360_isda_np,
+    _thirty_360_us_np,
+    _business_252_np,
+)
+
+
+_FRACTION_HANDLERS = (
+    None,
+    lambda start, end, maturity, calendar, payment, frequency: _act_360(start, end),
+    lambda start, end, maturity, calendar, payment, frequency: _act_365(start, end),
+    lambda start, end, maturity, calendar, payment, frequency: _validate_and_calc_icma_365(
+        start, end, maturity, payment, frequency
+    ),
+    lambda start, end, maturity, calendar, payment, frequency: _act_365_nl(start, end),
+    lambda start, end, maturity, calendar, payment, frequency: _act_act(start, end),
+    lambda start, end, maturity, calendar, payment, frequency: _act_act_afb(start, end),
+    lambda start, end, maturity, calendar, payment, frequency: _validate_and_calc_icma(
+        start, end, maturity, payment, frequency
+    ),
+    lambda start, end, maturity, calendar, payment, frequency: _thirty_360(start, end),
+    lambda start, end, maturity, calendar, payment, frequency: _thirty_360_e(start, end),
+    lambda start, end, maturity, calendar, payment, frequency: _validate_and_calc_isda(start, end, maturity),
+    lambda start, end, maturity, calendar, payment, frequency: _thirty_360_us(start, end),
+    lambda start, end, maturity, calendar, payment, frequency: _validate_and_calc_business(start, end, calendar),
+)
+
+
+@lru_cache(maxsize=16384)
+def _fraction_cached(
+    day_count: DayCount,
+    start: date,
+    end: date,
+    maturity: Optional[date],
+    payment: Optional[date],
+    frequency: Optional[Frequency],
+) -> float:
+    """Memoized fraction evaluation for conventions that do not involve a calendar."""
+    return day_count._handler(start, end, maturity, None, payment, frequency)
+
+
+# Bind each member's handler as an attribute so dispatch is a plain attribute fetch
+for _member in DayCount:
+    _member._handler = _FRACTION_HANDLERS[_member]
@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class Frequency(Enum):
+class Frequency(IntEnum):
     """
     Enumeration representing frequency of events.
 
@@ -56,13 +56,7 @@ class Frequency(Enum):
             Number of times the frequency occurs in a year.
             For BIANNUAL returns 0.5, for ANNUAL returns 1, etc.
         """
-        if self == Frequency.ONCE or self == Frequency.OTHER:
-            return float('nan')
-        if self == Frequency.CONTINUOUS:
-            return float('inf')
-        if self == Frequency.BIANNUAL:
-            return 0.5
-        return abs(float(self.value))
+        return self._annual
 
     def period_months(self) -> float:
         """
@@ -74,16 +68,24 @@ class Frequency(Enum):
             Number of months between each occurrence.
             For ANNUAL returns 12, for SEMIANNUAL returns 6, etc.
         """
-        if self == Frequency.ONCE or self == Frequency.OTHER:
-            return float('nan')
-        if self == Frequency.CONTINUOUS:
-            return 0.0
-        if self == Frequency.BIANNUAL:
-            return 24.0
-        if self == Frequency.BIWEEKLY:
-            return 12 / 26
-        if self == Frequency.WEEKLY:
-            return 12 / 52
-        if self == Frequency.DAILY:
-            return 12 / 365
-        return 12 / self.value
+        return self._period_months
+
+
+# Bind each member's per-year count and period length as plain attributes so the
+# accessors are a single load; ONCE/OTHER have no defined values
+for _member, _annual, _months in [
+    (Frequency.ONCE, float('nan'), float('nan')),
+    (Frequency.BIANNUAL, 0.5, 24.0),
+    (Frequency.ANNUAL, 1.0, 12.0),
+    (Frequency.SEMIANNUAL, 2.0, 6.0),
+    (Frequency.QUARTERLY, 4.0, 3.0),
+    (Frequency.BIMONTHLY, 6.0, 2.0),
+    (Frequency.MONTHLY, 12.0, 1.0),
+    (Frequency.BIWEEKLY, 26.0, 12 / 26),
+    (Frequency.WEEKLY, 52.0, 12 / 52),
+    (Frequency.DAILY, 365.0, 12 / 365),
+    (Frequency.CONTINUOUS, float('inf'), 0.0),
+    (Frequency.OTHER, float('nan'), float('nan')),
+]:
+    _member._annual = _annual
+    _member._period_months = _months
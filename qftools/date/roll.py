@@ -1,11 +1,19 @@
 from datetime import date, timedelta
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 
 from .calendar import Calendar
 
+_TWO_DAYS = timedelta(days=2)
 
-class RollType(Enum):
+# Rolled dates are cached on the calendar they were rolled against; clear rather than evict when full
+_ROLL_CACHE_LIMIT = 1 << 15
+
+# Shared weekend-only calendar for calls that pass no calendar; holidays stay empty
+_DEFAULT_CALENDAR = Calendar('default', set())
+
+
+class RollType(IntEnum):
     """
     Enumeration for date rolling conventions.
 
@@ -67,50 +75,36 @@ class RollType(Enum):
             If calendar is None or roll type is invalid
         """
         if calendar is None:
-            calendar = Calendar('default', set())
-        return self._apply_roll_convention(date_, calendar)
+            calendar = _DEFAULT_CALENDAR
+
+        key = (date_.toordinal(), self._value_)
+        cache = calendar._roll_cache
+        result = cache.get(key)
+        if result is None:
+            result = self._apply_roll_convention(date_, calendar)
+            if len(cache) >= _ROLL_CACHE_LIMIT:
+                cache.clear()
+            cache[key] = result
+        return result
 
     def _apply_roll_convention(self, date_: date, calendar: Calendar) -> date:
         """Apply the specific roll convention."""
-        match self:
-            case RollType.FOLLOWING:
-                return calendar.adjust_up(date_)
-            case RollType.PREVIOUS:
-                return calendar.adjust_down(date_)
-            case RollType.MODIFIED_FOLLOWING:
-                return self._roll_modified_following(date_, calendar)
-            case RollType.MODIFIED_PREVIOUS:
-                return self._roll_modified_previous(date_, calendar)
-            case RollType.MODIFIED_FOLLOWING_EOM:
-                return calendar.adjust_down(_get_eom(date_))
-            case RollType.UNADJUSTED_EOM:
-                return _get_eom(date_)
-            case RollType.IMM:
-                return _get_imm_date(date_)
-            case RollType.CAD_IMM:
-                return _get_imm_date(date_) - timedelta(days=2)
-            case RollType.NONE:
-                return date_
-            case _:
-                raise ValueError(f'Unknown roll type: {self}')
-
-    def _roll_modified_following(self, date_: date, calendar: Calendar) -> date:
-        """Handle modified following roll logic."""
-        result = calendar.adjust_up(date_)
-        return calendar.adjust_down(date_) if result.month != date_.month else result
-
-    def _roll_modified_previous(self, date_: date, calendar: Calendar) -> date:
-        """Handle modified previous roll logic."""
-        result = calendar.adjust_down(date_)
-        return calendar.adjust_up(date_) if result.month != date_.month else result
+        handler = _ROLL_HANDLERS.get(self)
+        if handler is None:
+            raise ValueError(f'Unknown roll type: {self}')
+        return handler(date_, calendar)
+
+
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 
 def _get_eom(date_: date) -> date:
     """Get end of month date."""
-    if date_.month == 12:
-        return date(date_.year + 1, 1, 1) - timedelta(days=1)
-    else:
-        return date(date_.year, date_.month + 1, 1) - timedelta(days=1)
+    year, month = date_.year, date_.month
+    day = _MONTH_DAYS[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        day = 29
+    return date(year, month, day)
 
 
 def _get_bom(date_: date) -> date:
@@ -120,11 +114,20 @@ def _get_bom(date_: date) -> date:
 
 def _get_imm_date(date_: date) -> date:
     """Get IMM date (third Wednesday of the month)."""
-    first_day = _get_bom(date_)
-
-    # Find first Wednesday
-    while first_day.weekday() != 2:  # 2 = Wednesday
-        first_day += timedelta(days=1)
-
-    # Add two weeks to get third Wednesday
-    return first_day + timedelta(weeks=2)
+    # Third Wednesday is day 15 + days from the 1st to its first Wednesday (2 = Wednesday)
+    first_weekday = date(date_.year, date_.month, 1).weekday()
+    return date(date_.year, date_.month, 15 + (2 - first_weekday) % 7)
+
+
+# Handler per roll convention, looked up once per roll instead of walking a match statement
+_ROLL_HANDLERS = {
+    RollType.MODIFIED_FOLLOWING: lambda date_, calendar: calendar.adjust_modified_following(date_),
+    RollType.FOLLOWING: lambda date_, calendar: calendar.adjust_up(date_),
+    RollType.MODIFIED_PREVIOUS: lambda date_, calendar: calendar.adjust_modified_previous(date_),
+    RollType.PREVIOUS: lambda date_, calendar: calendar.adjust_down(date_),
+    RollType.NONE: lambda date_, calendar: date_,
+    RollType.MODIFIED_FOLLOWING_EOM: lambda date_, calendar: calendar.adjust_down(_get_eom(date_)),
+    RollType.IMM: lambda date_, calendar: _get_imm_date(date_),
+    RollType.CAD_IMM: lambda date_, calendar: _get_imm_date(date_) - _TWO_DAYS,
+    RollType.UNADJUSTED_EOM: lambda date_, calendar: _get_eom(date_),
+}
@@ -1,25 +1,43 @@
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 
 from .frequency import Frequency
 
 
-class TenorUnit(Enum):
-    """Units used to describe tenor periods."""
+class TenorUnit(IntEnum):
+    """Units used to describe tenor periods; members compare as plain ints on hot paths."""
 
-    DAY = 'D'
-    WEEK = 'W'
-    MONTH = 'M'
-    YEAR = 'Y'
+    DAY = 0
+    WEEK = 1
+    MONTH = 2
+    YEAR = 3
 
     def __str__(self):
         """Return the string representation of the tenor unit."""
-        return self.value
+        return self._char
+
+
+# Unit character per member (indexed by value) and the reverse map used when parsing
+_UNIT_CHARS = ('D', 'W', 'M', 'Y')
+_UNIT_MAP = {'D': TenorUnit.DAY, 'W': TenorUnit.WEEK, 'M': TenorUnit.MONTH, 'Y': TenorUnit.YEAR}
+
+# Bind each member's character as a plain attribute so __str__ is a single load
+for _member in TenorUnit:
+    _member._char = _UNIT_CHARS[_member]
+
+# Exact base unit and conversion factor per unit: year/month reduce to months, week/day to days
+_UNIT_GROUPS = {
+    TenorUnit.DAY: (TenorUnit.DAY, 1),
+    TenorUnit.WEEK: (TenorUnit.DAY, 7),
+    TenorUnit.MONTH: (TenorUnit.MONTH, 1),
+    TenorUnit.YEAR: (TenorUnit.MONTH, 12),
+}
 
 
 class Tenor:
     """Class representing a time tenor (amount + unit)."""
 
-    __slots__ = ['amount', 'unit']
+    __slots__ = ['amount', 'unit', '_hash']
 
     def __init__(self, amount: int, unit: TenorUnit):
         """
@@ -43,6 +61,16 @@ class Tenor:
             raise ValueError(f'Unit must be a TenorUnit, got {type(unit)}')
         self.amount = amount
         self.unit = unit
+        self._hash = hash((amount, unit))
+
+    @classmethod
+    def _make(cls, amount: int, unit: TenorUnit) -> 'Tenor':
+        """Build a Tenor from known-valid arguments, bypassing __init__ validation."""
+        tenor = cls.__new__(cls)
+        tenor.amount = amount
+        tenor.unit = unit
+        tenor._hash = hash((amount, unit))
+        return tenor
 
     @classmethod
     def from_string(cls, tenor_str: str) -> 'Tenor':
@@ -63,12 +91,7 @@ class Tenor:
         ValueError
             If string format is invalid
         """
-        try:
-            amount = int(tenor_str[:-1])
-            unit = TenorUnit(tenor_str[-1])
-            return cls(amount, unit)
-        except (ValueError, IndexError) as e:
-            raise ValueError(f'Invalid tenor string format: {tenor_str}') from e
+        return _parse_tenor(tenor_str)
 
     @classmethod
     def from_frequency(cls, freq: Frequency) -> 'Tenor':
@@ -89,23 +112,12 @@ class Tenor:
         ValueError
             If frequency cannot be converted to tenor
         """
-        if freq == Frequency.ONCE:
-            return cls(0, TenorUnit.YEAR)
-        elif freq == Frequency.CONTINUOUS:
-            raise ValueError('Cannot convert CONTINUOUS frequency to tenor')
-        elif freq == Frequency.BIANNUAL:
-            return cls(2, TenorUnit.YEAR)
-        elif freq == Frequency.ANNUAL:
-            return cls(1, TenorUnit.YEAR)
-        elif freq in (Frequency.SEMIANNUAL, Frequency.QUARTERLY, Frequency.BIMONTHLY, Frequency.MONTHLY):
-            months = freq.period_months()
-            return cls(int(months), TenorUnit.MONTH)
-        elif freq in (Frequency.BIWEEKLY, Frequency.WEEKLY):
-            return cls(52 // freq.value, TenorUnit.WEEK)
-        elif freq == Frequency.DAILY:
-            return cls(1, TenorUnit.DAY)
-        else:
+        tenor = _FREQ_TO_TENOR.get(freq)
+        if tenor is None:
+            if freq == Frequency.CONTINUOUS:
+                raise ValueError('Cannot convert CONTINUOUS frequency to tenor')
             raise ValueError(f'Unknown frequency: {freq}')
+        return tenor
 
     def __str__(self) -> str:
         """Return compact string representation."""
@@ -117,26 +129,23 @@ class Tenor:
 
     def __eq__(self, other: 'Tenor') -> bool:
         """Check if two Tenor objects are equal."""
+        if self is other:
+            return True
         if not isinstance(other, Tenor):
             return NotImplemented
         if self.amount == 0 and other.amount == 0:
             return True
-        try:
-            match (self.unit, other.unit):
-                case (unit, other_unit) if unit == other_unit:
-                    return self.amount == other.amount
-                case (TenorUnit.YEAR | TenorUnit.MONTH, TenorUnit.YEAR | TenorUnit.MONTH):
-                    return self._convert_to_unit(TenorUnit.MONTH) == other._convert_to_unit(TenorUnit.MONTH)
-                case (TenorUnit.WEEK | TenorUnit.DAY, TenorUnit.WEEK | TenorUnit.DAY):
-                    return self._convert_to_unit(TenorUnit.DAY) == other._convert_to_unit(TenorUnit.DAY)
-                case _:
-                    return False
-        except ValueError:
+        if self.unit is other.unit:
+            return self.amount == other.amount
+        base, factor = _UNIT_GROUPS[self.unit]
+        other_base, other_factor = _UNIT_GROUPS[other.unit]
+        if base is not other_base:
             return False
+        return self.amount * factor == other.amount * other_factor
 
     def __hash__(self) -> int:
-        """Return the hash of the Tenor object."""
-        return hash((self.amount, self.unit))
+        """Return the hash of the Tenor object, precomputed at construction."""
+        return self._hash
 
     def _convert_to_unit(self, target_unit: TenorUnit, approx: bool = False) -> int:
         """Convert amount to target unit if possible.
@@ -158,21 +167,7 @@ class Tenor:
         ValueError
             If conversion is not possible or requires approximation when approx=False
         """
-        match (self.unit, target_unit):
-            case (unit, target) if unit == target:
-                return self.amount
-            case (TenorUnit.YEAR, TenorUnit.MONTH):
-                return self.amount * 12
-            case (TenorUnit.WEEK, TenorUnit.DAY):
-                return self.amount * 7
-            case (TenorUnit.YEAR, TenorUnit.DAY) if approx:
-                return int(self.amount * 365.25)
-            case (TenorUnit.MONTH, TenorUnit.DAY) if approx:
-                return int(self.amount * 30.4375)
-            case (TenorUnit.YEAR | TenorUnit.MONTH, TenorUnit.DAY) if not approx:
-                raise ValueError(f'Cannot convert {self.unit} to {target_unit} without approximation')
-            case _:
-                raise ValueError(f'Cannot convert {self.unit} to {target_unit}')
+        return _convert_cached(self.amount, self.unit, target_unit, approx)
 
     def __add__(self, other: 'Tenor') -> 'Tenor':
         """
@@ -195,38 +190,35 @@ class Tenor:
         """
         if not isinstance(other, Tenor):
             return NotImplemented
-
-        if self.amount == 0:
-            return Tenor(other.amount, other.unit)
-        if other.amount == 0:
-            return Tenor(self.amount, self.unit)
-
-        try:
-            match (self.unit, other.unit):
-                case (unit, other_unit) if unit == other_unit:
-                    return Tenor(self.amount + other.amount, self.unit)
-                case (TenorUnit.YEAR | TenorUnit.MONTH, TenorUnit.YEAR | TenorUnit.MONTH):
-                    months = self._convert_to_unit(TenorUnit.MONTH) + other._convert_to_unit(TenorUnit.MONTH)
-                    return Tenor(months, TenorUnit.MONTH)
-                case (TenorUnit.WEEK | TenorUnit.DAY, TenorUnit.WEEK | TenorUnit.DAY):
-                    days = self._convert_to_unit(TenorUnit.DAY) + other._convert_to_unit(TenorUnit.DAY)
-                    return Tenor(days, TenorUnit.DAY)
-                case _:
-                    raise ValueError(f'Cannot add {self} and {other}')
-        except ValueError as e:
-            raise ValueError(f'Cannot add {self} and {other}: {e}')
+        return self._addsub(other, 1)
 
     def __sub__(self, other: 'Tenor') -> 'Tenor':
         """Subtract two Tenor objects."""
         if not isinstance(other, Tenor):
             return NotImplemented
-        return self + Tenor(-other.amount, other.unit)
+        return self._addsub(other, -1)
+
+    def _addsub(self, other: 'Tenor', sign: int) -> 'Tenor':
+        """Add or subtract another tenor without building an intermediate negated Tenor."""
+        other_amount = sign * other.amount
+        if self.amount == 0:
+            return Tenor._make(other_amount, other.unit)
+        if other_amount == 0:
+            return Tenor._make(self.amount, self.unit)
+
+        if self.unit is other.unit:
+            return Tenor._make(self.amount + other_amount, self.unit)
+        base, factor = _UNIT_GROUPS[self.unit]
+        other_base, other_factor = _UNIT_GROUPS[other.unit]
+        if base is not other_base:
+            raise ValueError(f'Cannot add {self} and {other}')
+        return Tenor._make(self.amount * factor + other_amount * other_factor, base)
 
     def __mul__(self, n: int) -> 'Tenor':
         """Multiply a Tenor object by an integer."""
         if not isinstance(n, int):
             return NotImplemented
-        return Tenor(self.amount * n, self.unit)
+        return Tenor._make(self.amount * n, self.unit)
 
     def __rmul__(self, n: int) -> 'Tenor':
         """Multiply a Tenor object by an integer."""
@@ -240,36 +232,20 @@ class Tenor:
             raise ZeroDivisionError('Cannot divide tenor by zero')
 
         if self.amount % n == 0:
-            return Tenor(self.amount // n, self.unit)
+            return Tenor._make(self.amount // n, self.unit)
 
         match self.unit:
             case TenorUnit.YEAR:
                 months = self._convert_to_unit(TenorUnit.MONTH)
                 if months % n == 0:
-                    return Tenor(months // n, TenorUnit.MONTH)
+                    return Tenor._make(months // n, TenorUnit.MONTH)
             case TenorUnit.WEEK:
                 days = self._convert_to_unit(TenorUnit.DAY)
                 if days % n == 0:
-                    return Tenor(days // n, TenorUnit.DAY)
+                    return Tenor._make(days // n, TenorUnit.DAY)
 
         raise ValueError(f'{self} cannot be divided by {n}')
 
-    def _month_to_frequency(self, amount: int) -> Frequency:
-        """Convert month amount to frequency."""
-        match amount:
-            case 1:
-                return Frequency.MONTHLY
-            case 2:
-                return Frequency.BIMONTHLY
-            case 3:
-                return Frequency.QUARTERLY
-            case 6:
-                return Frequency.SEMIANNUAL
-            case 12:
-                return Frequency.ANNUAL
-            case _:
-                return Frequency.OTHER
-
     def to_frequency(self) -> Frequency:
         """Convert tenor to frequency if possible.
 
@@ -277,65 +253,124 @@ class Tenor:
         -------
             Frequency enum value representing this tenor
         """
-        if self.amount == 0:
-            return Frequency.ONCE
-        if self.amount < 0:
-            return Frequency.OTHER
-
-        try:
-            match self.unit:
-                case TenorUnit.YEAR:
-                    return self._month_to_frequency(self._convert_to_unit(TenorUnit.MONTH))
-                case TenorUnit.MONTH:
-                    return self._month_to_frequency(self.amount)
-                case TenorUnit.WEEK:
-                    return (
-                        Frequency.WEEKLY
-                        if self.amount == 1
-                        else Frequency.BIWEEKLY
-                        if self.amount == 2
-                        else Frequency.OTHER
-                    )
-                case TenorUnit.DAY:
-                    return Frequency.DAILY if self.amount == 1 else Frequency.OTHER
-        except ValueError:
-            return Frequency.OTHER
+        return _to_frequency_cached(self.amount, self.unit)
 
     def __lt__(self, other: 'Tenor') -> bool:
         """Compare if this tenor is less than another tenor."""
         if not isinstance(other, Tenor):
             return NotImplemented
 
-        try:
-            match (self.unit, other.unit):
-                case (unit, other_unit) if unit == other_unit:
-                    return self.amount < other.amount
-                case (TenorUnit.YEAR | TenorUnit.MONTH, TenorUnit.YEAR | TenorUnit.MONTH):
-                    return self._convert_to_unit(TenorUnit.MONTH) < other._convert_to_unit(TenorUnit.MONTH)
-                case (TenorUnit.WEEK | TenorUnit.DAY, TenorUnit.WEEK | TenorUnit.DAY):
-                    return self._convert_to_unit(TenorUnit.DAY) < other._convert_to_unit(TenorUnit.DAY)
-                case _:
-                    # Allow approximate comparison for different unit types
-                    return self._convert_to_unit(TenorUnit.DAY, approx=True) < other._convert_to_unit(
-                        TenorUnit.DAY, approx=True
-                    )
-        except ValueError as e:
-            raise ValueError(f'Cannot compare {self} and {other}: {e}')
+        if self.unit is other.unit:
+            return self.amount < other.amount
+        base, factor = _UNIT_GROUPS[self.unit]
+        other_base, other_factor = _UNIT_GROUPS[other.unit]
+        if base is other_base:
+            return self.amount * factor < other.amount * other_factor
+        # Allow approximate comparison for different unit types
+        return self._convert_to_unit(TenorUnit.DAY, approx=True) < other._convert_to_unit(TenorUnit.DAY, approx=True)
 
     def __le__(self, other: 'Tenor') -> bool:
         """Compare if this tenor is less than or equal to another tenor."""
         if not isinstance(other, Tenor):
             return NotImplemented
+        if self.unit is other.unit:
+            return self.amount <= other.amount
         return self < other or self == other
 
     def __gt__(self, other: 'Tenor') -> bool:
         """Compare if this tenor is greater than another tenor."""
         if not isinstance(other, Tenor):
             return NotImplemented
+        if self.unit is other.unit:
+            return self.amount > other.amount
         return not (self <= other)
 
     def __ge__(self, other: 'Tenor') -> bool:
         """Compare if this tenor is greater than or equal to another tenor."""
         if not isinstance(other, Tenor):
             return NotImplemented
+        if self.unit is other.unit:
+            return self.amount >= other.amount
         return not (self < other)
+
+
+# Convertible frequencies mapped to shared Tenor instances; CONTINUOUS and OTHER stay out as error cases
+_FREQ_TO_TENOR = {
+    Frequency.ONCE: Tenor._make(0, TenorUnit.YEAR),
+    Frequency.BIANNUAL: Tenor._make(2, TenorUnit.YEAR),
+    Frequency.ANNUAL: Tenor._make(1, TenorUnit.YEAR),
+    Frequency.SEMIANNUAL: Tenor._make(6, TenorUnit.MONTH),
+    Frequency.QUARTERLY: Tenor._make(3, TenorUnit.MONTH),
+    Frequency.BIMONTHLY: Tenor._make(2, TenorUnit.MONTH),
+    Frequency.MONTHLY: Tenor._make(1, TenorUnit.MONTH),
+    Frequency.BIWEEKLY: Tenor._make(2, TenorUnit.WEEK),
+    Frequency.WEEKLY: Tenor._make(1, TenorUnit.WEEK),
+    Frequency.DAILY: Tenor._make(1, TenorUnit.DAY),
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_tenor(tenor_str: str) -> Tenor:
+    """Parse a tenor string, memoized since curve configs repeat the same handful of tenors."""
+    try:
+        amount = int(tenor_str[:-1])
+        unit = _UNIT_MAP[tenor_str[-1]]
+        return Tenor(amount, unit)
+    except (ValueError, KeyError, IndexError) as e:
+        raise ValueError(f'Invalid tenor string format: {tenor_str}') from e
+
+
+@lru_cache(maxsize=4096)
+def _convert_cached(amount: int, unit: TenorUnit, target_unit: TenorUnit, approx: bool) -> int:
+    """Convert an amount between tenor units, memoized over the small set of tenors in actual use."""
+    match (unit, target_unit):
+        case (unit_, target) if unit_ == target:
+            return amount
+        case (TenorUnit.YEAR, TenorUnit.MONTH):
+            return amount * 12
+        case (TenorUnit.WEEK, TenorUnit.DAY):
+            return amount * 7
+        case (TenorUnit.YEAR, TenorUnit.DAY) if approx:
+            return int(amount * 365.25)
+        case (TenorUnit.MONTH, TenorUnit.DAY) if approx:
+            return int(amount * 30.4375)
+        case (TenorUnit.YEAR | TenorUnit.MONTH, TenorUnit.DAY) if not approx:
+            raise ValueError(f'Cannot convert {unit} to {target_unit} without approximation')
+        case _:
+            raise ValueError(f'Cannot convert {unit} to {target_unit}')
+
+
+def _month_to_frequency(amount: int) -> Frequency:
+    """Convert month amount to frequency."""
+    match amount:
+        case 1:
+            return Frequency.MONTHLY
+        case 2:
+            return Frequency.BIMONTHLY
+        case 3:
+            return Frequency.QUARTERLY
+        case 6:
+            return Frequency.SEMIANNUAL
+        case 12:
+            return Frequency.ANNUAL
+        case _:
+            return Frequency.OTHER
+
+
+@lru_cache(maxsize=4096)
+def _to_frequency_cached(amount: int, unit: TenorUnit) -> Frequency:
+    """Classify an (amount, unit) pair as a Frequency, memoized per distinct tenor."""
+    if amount == 0:
+        return Frequency.ONCE
+    if amount < 0:
+        return Frequency.OTHER
+
+    match unit:
+        case TenorUnit.YEAR:
+            return _month_to_frequency(amount * 12)
+        case TenorUnit.MONTH:
+            return _month_to_frequency(amount)
+        case TenorUnit.WEEK:
+            return Frequency.WEEKLY if amount == 1 else Frequency.BIWEEKLY if amount == 2 else Frequency.OTHER
+        case TenorUnit.DAY:
+            return Frequency.DAILY if amount == 1 else Frequency.OTHER
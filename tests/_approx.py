@@ -0,0 +1,3 @@
+def close(a: float, b: float, rel: float = 1e-10) -> bool:
+    """Check two floats agree to a relative tolerance without building approx wrappers."""
+    return abs(a - b) <= rel * max(abs(a), abs(b))
@@ -0,0 +1,15 @@
+from datetime import date
+
+import pytest
+
+from qftools.date.calendar import Calendar
+
+
+@pytest.fixture(scope='session')
+def calendar():
+    """Shared test calendar with weekends and some holidays; no test mutates it."""
+    holidays = {
+        date(2024, 1, 1),  # New Year's Day
+        date(2024, 12, 25),  # Christmas
+    }
+    return Calendar('test', holidays)
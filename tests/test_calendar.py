@@ -79,6 +79,29 @@ def test_add_business_days(calendar):
     assert result == date(2023, 12, 28)  # Previous Friday
 
 
+def test_business_days_between(calendar):
+    """Test counting business days in a half-open range."""
+    # Jan 1 is a holiday, Jan 2-5 are business days, Jan 6-7 are the weekend
+    assert calendar.business_days_between(date(2024, 1, 1), date(2024, 1, 8)) == 4
+
+    # Empty range
+    assert calendar.business_days_between(date(2024, 1, 2), date(2024, 1, 2)) == 0
+
+    # Reversed range returns the negated count
+    assert calendar.business_days_between(date(2024, 1, 8), date(2024, 1, 1)) == -4
+
+
+def test_business_days_between_weekend_holiday():
+    """Test that holidays falling on a weekend are not subtracted twice."""
+    # Saturday Jan 6 is already a weekend day; only Monday Jan 8 reduces the count
+    cal = Calendar('test', {date(2024, 1, 6), date(2024, 1, 8)})
+    assert cal.business_days_between(date(2024, 1, 1), date(2024, 1, 13)) == 9
+
+    # Friday-Saturday weekend: the Friday Jan 5 holiday is already off, Wednesday Jan 10 is not
+    cal = Calendar('test', {date(2024, 1, 5), date(2024, 1, 10)}, {Weekend.FRIDAY, Weekend.SATURDAY})
+    assert cal.business_days_between(date(2024, 1, 1), date(2024, 1, 13)) == 8
+
+
 def test_adjust_up_down(calendar):
     """Test adjusting dates up and down to business days."""
     holiday = date(2024, 1, 1)  # New Year's Day (holiday)
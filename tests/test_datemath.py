@@ -1,24 +1,14 @@
 from datetime import date
 
+import numpy as np
 import pytest
 
-from qftools.date.calendar import Calendar
 from qftools.date.datemath import DateMath, _add_months, _add_years
 from qftools.date.frequency import Frequency
 from qftools.date.roll import RollType
 from qftools.date.tenor import TenorUnit
 
 
-@pytest.fixture
-def calendar():
-    """Create a test calendar with weekends and some holidays."""
-    holidays = {
-        date(2024, 1, 1),  # New Year's Day
-        date(2024, 12, 25),  # Christmas
-    }
-    return Calendar('test', holidays)
-
-
 def test_add_tenor_basic():
     """Test basic tenor addition without rolling."""
     base_date = date(2024, 1, 15)
@@ -59,6 +49,37 @@ def test_add_tenor_invalid():
         DateMath.add_tenor(date(2024, 1, 1), 1, None)
 
 
+@pytest.mark.parametrize(
+    'roll_type', [None, RollType.FOLLOWING, RollType.MODIFIED_FOLLOWING, RollType.PREVIOUS, RollType.UNADJUSTED_EOM]
+)
+def test_add_tenor_batch_matches_scalar(calendar, roll_type):
+    """Test that add_tenor_batch matches element-wise add_tenor."""
+    base_dates = [
+        date(2023, 12, 30),  # Saturday
+        date(2024, 1, 15),
+        date(2024, 1, 31),  # Month end
+        date(2024, 2, 29),  # Leap day
+        date(2024, 6, 6),
+    ]
+    dates = np.array(base_dates, dtype='datetime64[D]')
+
+    for unit in TenorUnit:
+        for amount in (-13, -1, 0, 1, 2, 25):
+            result = DateMath.add_tenor_batch(dates, amount, unit, roll_type=roll_type, calendar=calendar)
+            expected = [
+                DateMath.add_tenor(date_, amount, unit, roll_type=roll_type, calendar=calendar) for date_ in base_dates
+            ]
+            assert result.tolist() == expected
+
+
+def test_add_tenor_batch_invalid():
+    """Test invalid tenor unit in batch addition."""
+    dates = np.array([date(2024, 1, 1)], dtype='datetime64[D]')
+
+    with pytest.raises(ValueError, match='Invalid tenor unit'):
+        DateMath.add_tenor_batch(dates, 1, None)
+
+
 def test_generate_dates_forward():
     """Test forward date generation."""
     start = date(2024, 1, 1)
@@ -97,6 +118,26 @@ def test_generate_dates_reverse():
     assert dates == expected
 
 
+@pytest.mark.parametrize('reverse', [False, True])
+@pytest.mark.parametrize('frequency', [Frequency.MONTHLY, Frequency.QUARTERLY, Frequency.SEMIANNUAL])
+def test_generate_dates_np_matches_list(calendar, reverse, frequency):
+    """Test that generate_dates_np mirrors generate_dates as a datetime64 array."""
+    start = date(2024, 1, 1)
+    roll = date(2024, 1, 15)
+    maturity = date(2025, 12, 15)
+
+    for roll_type in (None, RollType.FOLLOWING, RollType.MODIFIED_FOLLOWING, RollType.UNADJUSTED_EOM):
+        for cal in (None, calendar):
+            result = DateMath.generate_dates_np(
+                start, roll, maturity, frequency=frequency, roll_type=roll_type, reverse=reverse, calendar=cal
+            )
+            expected = DateMath.generate_dates(
+                start, roll, maturity, frequency=frequency, roll_type=roll_type, reverse=reverse, calendar=cal
+            )
+            assert result.dtype == np.dtype('datetime64[D]')
+            assert result.tolist() == expected
+
+
 def test_generate_dates_invalid():
     """Test invalid date generation cases."""
     with pytest.raises(ValueError, match='Dates must be in order'):
@@ -1,45 +1,39 @@
 from datetime import date
 
-import pytest
-
-from qftools.date.calendar import Calendar
 from qftools.date.roll import RollType, _get_bom, _get_eom, _get_imm_date
 
-
-@pytest.fixture
-def calendar():
-    """Create a test calendar with weekends and some holidays."""
-    holidays = {
-        date(2024, 1, 1),  # New Year's Day
-        date(2024, 12, 25),  # Christmas
-    }
-    return Calendar('test', holidays)
+# Date anchors shared across tests; constructed once at import
+JAN1_2024 = date(2024, 1, 1)  # Monday, also a holiday
+JAN5_2024 = date(2024, 1, 5)  # Friday
+JAN6_2024 = date(2024, 1, 6)  # Saturday
+JAN8_2024 = date(2024, 1, 8)  # Monday
+JAN15_2024 = date(2024, 1, 15)
 
 
 def test_roll_following(calendar):
     """Test FOLLOWING roll convention."""
     # Friday to Monday
-    assert RollType.FOLLOWING.roll(date(2024, 1, 5), calendar) == date(2024, 1, 5)
+    assert RollType.FOLLOWING.roll(JAN5_2024, calendar) == JAN5_2024
     # Saturday to Monday
-    assert RollType.FOLLOWING.roll(date(2024, 1, 6), calendar) == date(2024, 1, 8)
+    assert RollType.FOLLOWING.roll(JAN6_2024, calendar) == JAN8_2024
     # Holiday to next business day
-    assert RollType.FOLLOWING.roll(date(2024, 1, 1), calendar) == date(2024, 1, 2)
+    assert RollType.FOLLOWING.roll(JAN1_2024, calendar) == date(2024, 1, 2)
 
 
 def test_roll_previous(calendar):
     """Test PREVIOUS roll convention."""
     # Monday to Monday
-    assert RollType.PREVIOUS.roll(date(2024, 1, 8), calendar) == date(2024, 1, 8)
+    assert RollType.PREVIOUS.roll(JAN8_2024, calendar) == JAN8_2024
     # Saturday to Friday
-    assert RollType.PREVIOUS.roll(date(2024, 1, 6), calendar) == date(2024, 1, 5)
+    assert RollType.PREVIOUS.roll(JAN6_2024, calendar) == JAN5_2024
     # Holiday to previous business day
-    assert RollType.PREVIOUS.roll(date(2024, 1, 1), calendar) == date(2023, 12, 29)
+    assert RollType.PREVIOUS.roll(JAN1_2024, calendar) == date(2023, 12, 29)
 
 
 def test_roll_modified_following(calendar):
     """Test MODIFIED_FOLLOWING roll convention."""
     # Regular case - rolls forward
-    assert RollType.MODIFIED_FOLLOWING.roll(date(2024, 1, 6), calendar) == date(2024, 1, 8)
+    assert RollType.MODIFIED_FOLLOWING.roll(JAN6_2024, calendar) == JAN8_2024
     # Month boundary case - rolls backward
     assert RollType.MODIFIED_FOLLOWING.roll(date(2024, 1, 31), calendar) == date(2024, 1, 31)
     assert RollType.MODIFIED_FOLLOWING.roll(date(2024, 3, 30), calendar) == date(2024, 3, 29)
@@ -48,7 +42,7 @@ def test_roll_modified_following(calendar):
 def test_roll_modified_previous(calendar):
     """Test MODIFIED_PREVIOUS roll convention."""
     # Regular case - rolls backward
-    assert RollType.MODIFIED_PREVIOUS.roll(date(2024, 1, 6), calendar) == date(2024, 1, 5)
+    assert RollType.MODIFIED_PREVIOUS.roll(JAN6_2024, calendar) == JAN5_2024
     # Month boundary case - rolls forward
     assert RollType.MODIFIED_PREVIOUS.roll(date(2024, 2, 1), calendar) == date(2024, 2, 1)
 
@@ -59,12 +53,12 @@ def test_roll_modified_following_eom(calendar):
     assert RollType.MODIFIED_FOLLOWING_EOM.roll(date(2024, 1, 31), calendar) == date(2024, 1, 31)
     assert RollType.MODIFIED_FOLLOWING_EOM.roll(date(2024, 2, 29), calendar) == date(2024, 2, 29)
     # Mid-month case still goes to EOM
-    assert RollType.MODIFIED_FOLLOWING_EOM.roll(date(2024, 1, 15), calendar) == date(2024, 1, 31)
+    assert RollType.MODIFIED_FOLLOWING_EOM.roll(JAN15_2024, calendar) == date(2024, 1, 31)
 
 
 def test_roll_unadjusted_eom():
     """Test UNADJUSTED_EOM roll convention."""
-    assert RollType.UNADJUSTED_EOM.roll(date(2024, 1, 15), None) == date(2024, 1, 31)
+    assert RollType.UNADJUSTED_EOM.roll(JAN15_2024, None) == date(2024, 1, 31)
     assert RollType.UNADJUSTED_EOM.roll(date(2024, 2, 1), None) == date(2024, 2, 29)
     assert RollType.UNADJUSTED_EOM.roll(date(2024, 12, 10), None) == date(2024, 12, 31)
 
@@ -72,7 +66,7 @@ def test_roll_unadjusted_eom():
 def test_roll_imm():
     """Test IMM roll convention."""
     # Third Wednesday of month
-    assert RollType.IMM.roll(date(2024, 1, 1), None) == date(2024, 1, 17)
+    assert RollType.IMM.roll(JAN1_2024, None) == date(2024, 1, 17)
     assert RollType.IMM.roll(date(2024, 2, 1), None) == date(2024, 2, 21)
     assert RollType.IMM.roll(date(2024, 3, 1), None) == date(2024, 3, 20)
 
@@ -80,20 +74,20 @@ def test_roll_imm():
 def test_roll_cad_imm():
     """Test CAD_IMM roll convention."""
     # Third Wednesday minus 2 days
-    assert RollType.CAD_IMM.roll(date(2024, 1, 1), None) == date(2024, 1, 15)
+    assert RollType.CAD_IMM.roll(JAN1_2024, None) == JAN15_2024
     assert RollType.CAD_IMM.roll(date(2024, 2, 1), None) == date(2024, 2, 19)
     assert RollType.CAD_IMM.roll(date(2024, 3, 1), None) == date(2024, 3, 18)
 
 
 def test_roll_none(calendar):
     """Test NONE roll convention."""
-    test_date = date(2024, 1, 1)
+    test_date = JAN1_2024
     assert RollType.NONE.roll(test_date, calendar) == test_date
 
 
 def test_helper_functions():
     """Test roll helper functions."""
-    test_date = date(2024, 1, 15)
+    test_date = JAN15_2024
 
     # Test end of month
     assert _get_eom(test_date) == date(2024, 1, 31)
@@ -101,7 +95,7 @@ def test_helper_functions():
     assert _get_eom(date(2024, 12, 1)) == date(2024, 12, 31)
 
     # Test beginning of month
-    assert _get_bom(test_date) == date(2024, 1, 1)
+    assert _get_bom(test_date) == JAN1_2024
     assert _get_bom(date(2024, 12, 31)) == date(2024, 12, 1)
 
     # Test IMM date